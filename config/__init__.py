@@ -1,6 +1,8 @@
 """Configuration files and settings."""
 
 from .settings import (
+    Settings,
+    settings,
     ORACLE_HOST,
     ORACLE_PORT,
     ORACLE_SID,
@@ -0,0 +1,28 @@
+"""Process-wide cache of environment variables."""
+
+import functools
+import os
+import types
+from typing import Mapping, Optional
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=1)
+def _load() -> Mapping[str, str]:
+    """Load the .env file once and snapshot the resulting environment."""
+    load_dotenv()
+    return types.MappingProxyType(dict(os.environ))
+
+
+def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Get environment variable value.
+    
+    Args:
+        key: Environment variable name
+        default: Default value if not found
+        
+    Returns:
+        Environment variable value or default
+    """
+    return _load().get(key, default)
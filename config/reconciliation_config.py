@@ -1,30 +1,87 @@
 """Reconciliation configuration settings."""
 
-import os
-from dotenv import load_dotenv
-from typing import Optional
+from dataclasses import dataclass
+from ._env_cache import get_env
 
-load_dotenv()
 
+@dataclass(frozen=True, slots=True)
+class ReconciliationSettings:
+    """Reconciliation settings, read from the environment once per process."""
+    
+    # AI Model Configuration
+    OPENAI_API_KEY: str
+    OPENAI_MODEL: str
+    OPENAI_TEMPERATURE: float
+    
+    # Validation Thresholds
+    MIN_CONFIDENCE_SCORE: float
+    AUTO_RECONCILE_THRESHOLD: float
+    MANUAL_REVIEW_THRESHOLD: float
+    
+    # Business Rules
+    MAX_RECEIPT_AMOUNT: float
+    MIN_RECEIPT_AMOUNT: float
+    
+    # Reconciliation Settings
+    BATCH_SIZE: int
+    VALIDATION_WORKERS: int
+    UPDATE_WORKERS: int
+    UPDATE_BATCH_SIZE: int
+    RECEIPT_FETCH_ARRAYSIZE: int
+    VALIDATION_CACHE_SIZE: int
+    VALIDATION_CACHE_PATH: str
+    VALIDATION_CACHE_TTL: int
+    ENABLE_AUTO_RECONCILE: bool
+    LOG_LEVEL: str
+
+
+reconciliation_settings = ReconciliationSettings(
+    OPENAI_API_KEY=get_env("OPENAI_API_KEY", ""),
+    OPENAI_MODEL=get_env("OPENAI_MODEL", "gpt-4o-mini"),
+    OPENAI_TEMPERATURE=float(get_env("OPENAI_TEMPERATURE", "0")),
+    MIN_CONFIDENCE_SCORE=float(get_env("MIN_CONFIDENCE_SCORE", "80")),
+    AUTO_RECONCILE_THRESHOLD=float(get_env("AUTO_RECONCILE_THRESHOLD", "90")),
+    MANUAL_REVIEW_THRESHOLD=float(get_env("MANUAL_REVIEW_THRESHOLD", "70")),
+    MAX_RECEIPT_AMOUNT=float(get_env("MAX_RECEIPT_AMOUNT", "10000000")),
+    MIN_RECEIPT_AMOUNT=float(get_env("MIN_RECEIPT_AMOUNT", "0.01")),
+    BATCH_SIZE=int(get_env("RECONCILIATION_BATCH_SIZE", "10")),
+    VALIDATION_WORKERS=int(get_env("RECONCILIATION_VALIDATION_WORKERS", "8")),
+    UPDATE_WORKERS=int(get_env("RECONCILIATION_UPDATE_WORKERS", "4")),
+    UPDATE_BATCH_SIZE=int(get_env("RECONCILIATION_UPDATE_BATCH_SIZE", "200")),
+    RECEIPT_FETCH_ARRAYSIZE=int(get_env("RECEIPT_FETCH_ARRAYSIZE", "1000")),
+    VALIDATION_CACHE_SIZE=int(get_env("RECONCILIATION_VALIDATION_CACHE_SIZE", "1024")),
+    VALIDATION_CACHE_PATH=get_env("RECONCILIATION_VALIDATION_CACHE_PATH", ".cache/receipt_validation.sqlite3"),
+    VALIDATION_CACHE_TTL=int(get_env("RECONCILIATION_VALIDATION_CACHE_TTL", "604800")),
+    ENABLE_AUTO_RECONCILE=get_env("ENABLE_AUTO_RECONCILE", "true").lower() == "true",
+    LOG_LEVEL=get_env("RECONCILIATION_LOG_LEVEL", "INFO"),
+)
 
 # AI Model Configuration
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0"))
+OPENAI_API_KEY = reconciliation_settings.OPENAI_API_KEY
+OPENAI_MODEL = reconciliation_settings.OPENAI_MODEL
+OPENAI_TEMPERATURE = reconciliation_settings.OPENAI_TEMPERATURE
 
 # Validation Thresholds
-MIN_CONFIDENCE_SCORE = float(os.getenv("MIN_CONFIDENCE_SCORE", "80"))
-AUTO_RECONCILE_THRESHOLD = float(os.getenv("AUTO_RECONCILE_THRESHOLD", "90"))
-MANUAL_REVIEW_THRESHOLD = float(os.getenv("MANUAL_REVIEW_THRESHOLD", "70"))
+MIN_CONFIDENCE_SCORE = reconciliation_settings.MIN_CONFIDENCE_SCORE
+AUTO_RECONCILE_THRESHOLD = reconciliation_settings.AUTO_RECONCILE_THRESHOLD
+MANUAL_REVIEW_THRESHOLD = reconciliation_settings.MANUAL_REVIEW_THRESHOLD
 
 # Business Rules
-MAX_RECEIPT_AMOUNT = float(os.getenv("MAX_RECEIPT_AMOUNT", "10000000"))
-MIN_RECEIPT_AMOUNT = float(os.getenv("MIN_RECEIPT_AMOUNT", "0.01"))
-VALID_MONTHS = list(range(1, 13))
-VALID_YEARS = list(range(2000, 2101))
+MAX_RECEIPT_AMOUNT = reconciliation_settings.MAX_RECEIPT_AMOUNT
+MIN_RECEIPT_AMOUNT = reconciliation_settings.MIN_RECEIPT_AMOUNT
+MIN_YEAR = 2000
+MAX_YEAR = 2100
+VALID_MONTHS: frozenset[int] = frozenset(range(1, 13))
+VALID_YEARS: frozenset[int] = frozenset(range(MIN_YEAR, MAX_YEAR + 1))
 
 # Reconciliation Settings
-BATCH_SIZE = int(os.getenv("RECONCILIATION_BATCH_SIZE", "10"))
-ENABLE_AUTO_RECONCILE = os.getenv("ENABLE_AUTO_RECONCILE", "true").lower() == "true"
-LOG_LEVEL = os.getenv("RECONCILIATION_LOG_LEVEL", "INFO")
-
+BATCH_SIZE = reconciliation_settings.BATCH_SIZE
+VALIDATION_WORKERS = reconciliation_settings.VALIDATION_WORKERS
+UPDATE_WORKERS = reconciliation_settings.UPDATE_WORKERS
+UPDATE_BATCH_SIZE = reconciliation_settings.UPDATE_BATCH_SIZE
+RECEIPT_FETCH_ARRAYSIZE = reconciliation_settings.RECEIPT_FETCH_ARRAYSIZE
+VALIDATION_CACHE_SIZE = reconciliation_settings.VALIDATION_CACHE_SIZE
+VALIDATION_CACHE_PATH = reconciliation_settings.VALIDATION_CACHE_PATH  # empty disables the on-disk cache
+VALIDATION_CACHE_TTL = reconciliation_settings.VALIDATION_CACHE_TTL  # seconds
+ENABLE_AUTO_RECONCILE = reconciliation_settings.ENABLE_AUTO_RECONCILE
+LOG_LEVEL = reconciliation_settings.LOG_LEVEL
@@ -1,48 +1,104 @@
 """Configuration settings loaded from environment variables."""
 
-import os
-from dotenv import load_dotenv
-from typing import Optional
+import sys
+from dataclasses import dataclass
+from ._env_cache import get_env
 
-# Load environment variables from .env file
-load_dotenv()
 
+def _env_str(key: str, default: str) -> str:
+    """Read a string setting and intern it so every connection shares the same object."""
+    return sys.intern(get_env(key, default) or "")
 
-def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
-    """
-    Get environment variable value.
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Database connection settings, read from the environment once per process."""
+    
+    # Oracle Database Configuration
+    ORACLE_HOST: str
+    ORACLE_PORT: int
+    ORACLE_SID: str
+    ORACLE_USER: str
+    ORACLE_PASSWORD: str
+    ORACLE_POOL_MIN: int
+    ORACLE_POOL_MAX: int
+    ORACLE_STMT_CACHE_SIZE: int
+    ORACLE_THICK_MODE: bool
+    
+    # MySQL Database Configuration
+    MYSQL_HOST: str
+    MYSQL_PORT: int
+    MYSQL_DATABASE: str
+    MYSQL_USER: str
+    MYSQL_PASSWORD: str
     
-    Args:
-        key: Environment variable name
-        default: Default value if not found
-        
-    Returns:
-        Environment variable value or default
-    """
-    return os.getenv(key, default)
-
-
-# Oracle Database Configuration
-ORACLE_HOST = get_env("ORACLE_HOST", "localhost")
-ORACLE_PORT = int(get_env("ORACLE_PORT", "1521"))
-ORACLE_SID = get_env("ORACLE_SID", "")
-ORACLE_USER = get_env("ORACLE_USER", "")
-ORACLE_PASSWORD = get_env("ORACLE_PASSWORD", "")
-
-# MySQL Database Configuration
-MYSQL_HOST = get_env("MYSQL_HOST", "localhost")
-MYSQL_PORT = int(get_env("MYSQL_PORT", "3306"))
-MYSQL_DATABASE = get_env("MYSQL_DATABASE", "")
-MYSQL_USER = get_env("MYSQL_USER", "root")
-MYSQL_PASSWORD = get_env("MYSQL_PASSWORD", "")
-
-# PostgreSQL Database Configuration
-POSTGRES_HOST = get_env("POSTGRES_HOST", "localhost")
-POSTGRES_PORT = int(get_env("POSTGRES_PORT", "5432"))
-POSTGRES_DATABASE = get_env("POSTGRES_DATABASE", "postgres")
-POSTGRES_USER = get_env("POSTGRES_USER", "postgres")
-POSTGRES_PASSWORD = get_env("POSTGRES_PASSWORD", "")
-
-# SQLite Database Configuration
-SQLITE_DATABASE = get_env("SQLITE_DATABASE", ":memory:")
+    # PostgreSQL Database Configuration
+    POSTGRES_HOST: str
+    POSTGRES_PORT: int
+    POSTGRES_DATABASE: str
+    POSTGRES_USER: str
+    POSTGRES_PASSWORD: str
+    PG_POOL_MIN: int
+    PG_POOL_MAX: int
+    
+    # SQLite Database Configuration
+    SQLITE_DATABASE: str
+    
+    # Pooled connections: how long a successful ping is trusted, in milliseconds
+    LIVENESS_TTL_MS: int
+
+
+settings = Settings(
+    ORACLE_HOST=_env_str("ORACLE_HOST", "localhost"),
+    ORACLE_PORT=int(get_env("ORACLE_PORT", "1521")),
+    ORACLE_SID=_env_str("ORACLE_SID", ""),
+    ORACLE_USER=_env_str("ORACLE_USER", ""),
+    ORACLE_PASSWORD=get_env("ORACLE_PASSWORD", ""),
+    ORACLE_POOL_MIN=int(get_env("ORACLE_POOL_MIN", "2")),
+    ORACLE_POOL_MAX=int(get_env("ORACLE_POOL_MAX", "10")),
+    ORACLE_STMT_CACHE_SIZE=int(get_env("ORACLE_STMT_CACHE_SIZE", "50")),
+    ORACLE_THICK_MODE=get_env("ORACLE_THICK_MODE", "true").lower() == "true",
+    MYSQL_HOST=_env_str("MYSQL_HOST", "localhost"),
+    MYSQL_PORT=int(get_env("MYSQL_PORT", "3306")),
+    MYSQL_DATABASE=_env_str("MYSQL_DATABASE", ""),
+    MYSQL_USER=_env_str("MYSQL_USER", "root"),
+    MYSQL_PASSWORD=get_env("MYSQL_PASSWORD", ""),
+    POSTGRES_HOST=_env_str("POSTGRES_HOST", "localhost"),
+    POSTGRES_PORT=int(get_env("POSTGRES_PORT", "5432")),
+    POSTGRES_DATABASE=_env_str("POSTGRES_DATABASE", "postgres"),
+    POSTGRES_USER=_env_str("POSTGRES_USER", "postgres"),
+    POSTGRES_PASSWORD=get_env("POSTGRES_PASSWORD", ""),
+    PG_POOL_MIN=int(get_env("PG_POOL_MIN", "2")),
+    PG_POOL_MAX=int(get_env("PG_POOL_MAX", "10")),
+    SQLITE_DATABASE=_env_str("SQLITE_DATABASE", ":memory:"),
+    LIVENESS_TTL_MS=int(get_env("LXDB_LIVENESS_TTL_MS", "5000")),
+)
+
+# Module-level aliases kept for existing imports
+ORACLE_HOST = settings.ORACLE_HOST
+ORACLE_PORT = settings.ORACLE_PORT
+ORACLE_SID = settings.ORACLE_SID
+ORACLE_USER = settings.ORACLE_USER
+ORACLE_PASSWORD = settings.ORACLE_PASSWORD
+ORACLE_POOL_MIN = settings.ORACLE_POOL_MIN
+ORACLE_POOL_MAX = settings.ORACLE_POOL_MAX
+ORACLE_STMT_CACHE_SIZE = settings.ORACLE_STMT_CACHE_SIZE
+ORACLE_THICK_MODE = settings.ORACLE_THICK_MODE
+
+MYSQL_HOST = settings.MYSQL_HOST
+MYSQL_PORT = settings.MYSQL_PORT
+MYSQL_DATABASE = settings.MYSQL_DATABASE
+MYSQL_USER = settings.MYSQL_USER
+MYSQL_PASSWORD = settings.MYSQL_PASSWORD
+
+POSTGRES_HOST = settings.POSTGRES_HOST
+POSTGRES_PORT = settings.POSTGRES_PORT
+POSTGRES_DATABASE = settings.POSTGRES_DATABASE
+POSTGRES_USER = settings.POSTGRES_USER
+POSTGRES_PASSWORD = settings.POSTGRES_PASSWORD
+PG_POOL_MIN = settings.PG_POOL_MIN
+PG_POOL_MAX = settings.PG_POOL_MAX
+
+SQLITE_DATABASE = settings.SQLITE_DATABASE
 
+LIVENESS_TTL_MS = settings.LIVENESS_TTL_MS
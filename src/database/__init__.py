@@ -1,15 +1,13 @@
 """Database connection and update operations."""
 
-from .base import BaseDatabaseConnection
-from .oracle_connection import OracleConnection
-from .mysql_connection import MySQLConnection
-from .sqlite_connection import SQLiteConnection
-from .postgres_connection import PostgreSQLConnection
+import importlib
+from .base import BaseDatabaseConnection, PooledDatabaseConnection
 from .factory import DatabaseFactory
 from .connection_manager import ConnectionManager
 
 __all__ = [
     "BaseDatabaseConnection",
+    "PooledDatabaseConnection",
     "OracleConnection",
     "MySQLConnection",
     "SQLiteConnection",
@@ -18,3 +16,19 @@ __all__ = [
     "ConnectionManager",
 ]
 
+# Driver-backed classes are imported on first attribute access (PEP 562),
+# so importing this package does not load oracledb, mysql.connector or psycopg2
+_lazy_classes = {
+    "OracleConnection": ".oracle_connection",
+    "MySQLConnection": ".mysql_connection",
+    "SQLiteConnection": ".sqlite_connection",
+    "PostgreSQLConnection": ".postgres_connection",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_classes:
+        value = getattr(importlib.import_module(_lazy_classes[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,60 @@
 """Base database connection interface."""
 
+import asyncio
+import functools
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Dict, List
+from contextlib import contextmanager
+from typing import Optional, Any, Callable, Dict, List, Iterator, Iterable
+from config.settings import settings
+from src.utils.db_helpers import (iter_rows, exec_checked_out, exec_query_one, cached_rows, is_ddl,
+                                  invalidate_metadata_cache, RESULT_CACHE_TTL)
+
+# Process-wide driver pools for classes with SHARED_POOL set, keyed by get_pool_key()
+_shared_pools: Dict[tuple, Any] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def intern_config(value: Optional[str], default: str) -> str:
+    """
+    Resolve a string connection parameter, interning explicit values.
+    
+    Defaults from settings are already interned, so connections to the same host,
+    database and user share one string object per parameter.
+    """
+    return sys.intern(value) if value else default
 
 
 class BaseDatabaseConnection(ABC):
     """Abstract base class for all database connections."""
     
-    def __init__(self, connection_name: str = "default", **kwargs):
+    __slots__ = ("connection_name", "connection", "_connected", "_tx_depth", "_tx_failed", "_statements",
+                 "_cursor_tls", "_open_cursors", "__weakref__")
+    
+    # Share one pool per get_pool_key() across every instance in the process
+    SHARED_POOL = False
+    
+    def __init__(self, connection_name: str = "default"):
         """
         Initialize base database connection.
         
+        Subclasses keep their own connection parameters and expose the non-secret
+        ones through _public_config().
+        
         Args:
             connection_name: Unique name for this connection
-            **kwargs: Database-specific connection parameters
         """
-        self.connection_name = connection_name
+        self.connection_name = sys.intern(connection_name)
         self.connection: Optional[Any] = None
-        self.config = kwargs
+        # Updated on connect/disconnect and on connection-lost errors; read by is_connected_cheap()
+        self._connected = False
+        self._tx_depth = 0
+        self._tx_failed = False
+        self._statements: Dict[str, str] = {}  # prepare() name -> SQL text
+        self._cursor_tls = threading.local()  # one reusable cursor per (thread, session)
+        self._open_cursors: set = set()  # every cached cursor on this session, from any thread
     
     @abstractmethod
     def connect(self) -> bool:
@@ -44,6 +81,16 @@ class BaseDatabaseConnection(ABC):
         """
         pass
     
+    def is_connected_cheap(self) -> bool:
+        """
+        Check connection state without a round-trip to the server.
+        
+        Returns:
+            True if the last connect() succeeded and no disconnect or lost connection
+            has been seen since
+        """
+        return self._connected
+    
     @abstractmethod
     def get_connection(self) -> Optional[Any]:
         """
@@ -67,6 +114,119 @@ class BaseDatabaseConnection(ABC):
         """
         pass
     
+    def execute_query_one(self, query: str) -> Optional[tuple]:
+        """
+        Execute a SELECT query and return only its first row.
+        
+        Args:
+            query: SQL query string
+            
+        Returns:
+            First result row, or None if there is none or on error
+        """
+        return exec_query_one(self.connection, self._cursor, self.is_connected, self.connection_name,
+                              self.__class__.__name__, query, close_cursor=False, on_error=self._record_error)
+    
+    def execute_query_cached(self, query: str, ttl: float = RESULT_CACHE_TTL) -> Optional[List]:
+        """
+        Execute a catalog SELECT query, reusing its result for ttl seconds.
+        
+        For small metadata queries (all_users, all_tables, information_schema) that
+        only change with DDL; DDL run through execute_update() drops the cached results.
+        
+        Args:
+            query: SQL query string
+            ttl: Seconds a result is reused before the query runs again
+            
+        Returns:
+            List of result rows, or None on error
+        """
+        return cached_rows(self._result_cache_scope(), query, lambda: self.execute_query(query), ttl)
+    
+    def _result_cache_scope(self) -> tuple:
+        """Key under which this connection's cached results are stored, shared by connections to one database."""
+        return self.get_pool_key() or (self.__class__.__name__, id(self))
+    
+    def _cursor(self) -> Any:
+        """
+        Get this thread's reusable cursor on the current connection, creating it on first use.
+        
+        execute_query/execute_update/execute_many run on it instead of opening and closing
+        a cursor per call; it is closed by _drop_cursor() on disconnect.
+        """
+        cursor = getattr(self._cursor_tls, "cursor", None)
+        if cursor is None:
+            cursor = self._cursor_tls.cursor = self._track_cursor(self._new_cursor())
+        return cursor
+    
+    def _track_cursor(self, cursor: Any) -> Any:
+        """Register a cursor kept past the call that opened it, so _drop_cursor() closes it."""
+        self._open_cursors.add(cursor)
+        return cursor
+    
+    def _close_cursor(self, cursor: Any) -> None:
+        """Close a tracked cursor that is being dropped from a cache before disconnect."""
+        self._open_cursors.discard(cursor)
+        try:
+            cursor.close()
+        except Exception:
+            pass
+    
+    def _new_cursor(self) -> Any:
+        """Open the cursor handed out by _cursor()."""
+        return self.connection.cursor()
+    
+    def _drop_cursor(self) -> None:
+        """Close every thread's cached cursors on this session, before it is released."""
+        cursors, self._open_cursors = self._open_cursors, set()
+        for cursor in cursors:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        self._cursor_tls = threading.local()
+    
+    def clear_statement_cache(self) -> None:
+        """
+        Discard statements cached on the current session (cursors or server-side prepared statements).
+        
+        Called after DDL through execute_update(), since a cached statement may then describe
+        an object that changed; a no-op for drivers without such a cache.
+        """
+        pass
+    
+    def _after_ddl(self) -> None:
+        """Drop cached statements and cached catalog results once a DDL statement has run."""
+        self.clear_statement_cache()
+        invalidate_metadata_cache()
+    
+    def last_error(self) -> Optional[str]:
+        """
+        Get the driver error message of the last failed statement on this thread.
+        
+        Returns:
+            Error message, or None if no statement has failed since connecting
+        """
+        return getattr(self._cursor_tls, "error", None)
+    
+    def _record_error(self, exc: Exception) -> None:
+        """Remember a driver error for last_error(); passed to the helpers as on_error."""
+        self._cursor_tls.error = str(exc)
+    
+    def iter_query(self, query: str, arraysize: int = 10000) -> Iterator[tuple]:
+        """
+        Execute a SELECT query and stream its rows instead of materializing them.
+        
+        Args:
+            query: SQL query string
+            arraysize: Number of rows fetched per round-trip
+            
+        Yields:
+            Result rows as tuples
+        """
+        yield from iter_rows(self.connection, lambda: self.connection.cursor(), self.is_connected,
+                             self.connection_name, self.__class__.__name__, query, arraysize)
+    
     @abstractmethod
     def execute_update(self, query: str, params: Optional[tuple] = None) -> bool:
         """
@@ -81,6 +241,151 @@ class BaseDatabaseConnection(ABC):
         """
         pass
     
+    @abstractmethod
+    def execute_many(self, query: str, params_seq: Iterable[tuple], chunk_size: int = 1000) -> int:
+        """
+        Execute an INSERT/UPDATE/DELETE query once per parameter tuple.
+        
+        Rows are sent to the server in chunks of chunk_size and committed once at the end.
+        
+        Args:
+            query: SQL query string
+            params_seq: Iterable of parameter tuples
+            chunk_size: Number of parameter tuples sent per round-trip
+            
+        Returns:
+            Number of parameter rows executed, or -1 on error
+        """
+        pass
+    
+    def clone(self, connection_name: str) -> "BaseDatabaseConnection":
+        """
+        Create an unconnected connection with the same parameters under another name.
+        
+        Pooled clones draw sessions from the same pool when the class shares pools, so a
+        clone per worker thread gives each worker its own session.
+        
+        Args:
+            connection_name: Unique name for the new connection
+            
+        Returns:
+            New connection of the same type
+        """
+        return type(self)(connection_name=connection_name, password=getattr(self, "password", None),
+                          **self._public_config())
+    
+    def prepare(self, name: str, query: str) -> None:
+        """
+        Register a DML statement under a name for repeated execution.
+        
+        Every execution of a prepared name sends identical SQL text, so it hits the
+        backend's per-session statement cache and is parsed once per session
+        (server-side PREPARE on PostgreSQL and MySQL, the statement cache on Oracle
+        and SQLite).
+        
+        Args:
+            name: Name used with execute_prepared/prepare_many
+            query: SQL query string with placeholders
+        """
+        self._statements[name] = query
+    
+    def execute_prepared(self, name: str, params: Optional[tuple] = None) -> bool:
+        """
+        Execute a statement registered with prepare().
+        
+        Args:
+            name: Name the statement was prepared under
+            params: Optional parameters for the statement
+            
+        Returns:
+            True if successful, False otherwise
+            
+        Raises:
+            KeyError: If no statement was prepared under name
+        """
+        return self.execute_update(self._statements[name], params)
+    
+    def prepare_many(self, name: str, params_seq: Iterable[tuple], chunk_size: int = 1000, **kwargs: Any) -> int:
+        """
+        Execute a statement registered with prepare() once per parameter tuple.
+        
+        Args:
+            name: Name the statement was prepared under
+            params_seq: Iterable of parameter tuples
+            chunk_size: Number of parameter tuples sent per round-trip
+            **kwargs: Extra execute_many options of the backend (e.g. failed_rows on Oracle)
+            
+        Returns:
+            Number of parameter rows executed, or -1 on error
+            
+        Raises:
+            KeyError: If no statement was prepared under name
+        """
+        return self.execute_many(self._statements[name], params_seq, chunk_size, **kwargs)
+    
+    async def aexecute_query(self, query: str) -> Optional[List]:
+        """
+        Execute a SELECT query without blocking the event loop.
+        
+        The query runs on a worker thread using a connection checked out for that call,
+        so several awaits can be in flight at once (up to the pool size for pooled databases).
+        
+        Args:
+            query: SQL query string
+            
+        Returns:
+            List of result rows or None if error
+        """
+        return await asyncio.to_thread(exec_checked_out, self.checkout, self.connection_name,
+                                       self.__class__.__name__, query)
+    
+    async def aexecute_query_cached(self, query: str, ttl: float = RESULT_CACHE_TTL) -> Optional[List]:
+        """
+        Execute a catalog SELECT query without blocking the event loop, reusing its result for ttl seconds.
+        
+        The async counterpart of execute_query_cached(); a miss runs the query like aexecute_query().
+        
+        Args:
+            query: SQL query string
+            ttl: Seconds a result is reused before the query runs again
+            
+        Returns:
+            List of result rows, or None on error
+        """
+        load = functools.partial(exec_checked_out, self.checkout, self.connection_name,
+                                 self.__class__.__name__, query)
+        return await asyncio.to_thread(cached_rows, self._result_cache_scope(), query, load, ttl)
+    
+    async def aexecute_update(self, query: str, params: Optional[tuple] = None) -> bool:
+        """
+        Execute an INSERT/UPDATE/DELETE query without blocking the event loop.
+        
+        The statement commits on its own checked-out connection and does not join a
+        transaction() block open on this connection.
+        
+        Args:
+            query: SQL query string
+            params: Optional parameters for parameterized queries
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        ok = await asyncio.to_thread(exec_checked_out, self.checkout, self.connection_name,
+                                     self.__class__.__name__, query, params, False)
+        if ok and is_ddl(query):
+            invalidate_metadata_cache()
+        return ok
+    
+    @abstractmethod
+    def _public_config(self) -> Dict[str, Any]:
+        """
+        Get the connection parameters that are safe to display.
+        
+        Returns:
+            Dictionary of connection parameters, never including the password
+        """
+        pass
+    
     def get_info(self) -> Dict[str, Any]:
         """
         Get connection information.
@@ -91,10 +396,79 @@ class BaseDatabaseConnection(ABC):
         return {
             "name": self.connection_name,
             "type": self.__class__.__name__,
-            "connected": self.is_connected(),
-            "config": {k: v for k, v in self.config.items() if k != "password"}
+            "connected": self.is_connected_cheap(),
+            "config": self._public_config()
         }
     
+    def transaction(self) -> "_Transaction":
+        """
+        Group several execute_update/execute_many calls into a single commit.
+        
+        The transaction commits when the with-block exits normally and rolls back if the
+        block raises or any statement inside it failed. Nested blocks join the outer one.
+        
+        Example:
+            with conn.transaction():
+                for receipt_id in receipt_ids:
+                    conn.execute_update(query, (receipt_id,))
+        """
+        return _Transaction(self)
+    
+    @property
+    def in_transaction(self) -> bool:
+        """True while inside a transaction() block."""
+        return self._tx_depth > 0
+    
+    def _begin_transaction(self) -> None:
+        """Hook run when the outermost transaction() block is entered."""
+        pass
+    
+    def _end_transaction(self) -> None:
+        """Hook run after the outermost transaction() block has committed or rolled back."""
+        pass
+    
+    def _commit(self) -> None:
+        """Commit the current statement unless an explicit transaction is open."""
+        if not self._tx_depth:
+            self.connection.commit()
+    
+    def _rollback(self) -> None:
+        """Roll back after a failed statement, failing any open transaction."""
+        if self._tx_depth:
+            self._tx_failed = True
+        self.connection.rollback()
+    
+    def get_pool_key(self) -> Optional[tuple]:
+        """
+        Get the key identifying connections that can share a pool.
+        
+        Returns:
+            Tuple of (db_type, host, port, database, user), or None if not pooled
+        """
+        return None
+    
+    def get_pool(self) -> Optional[Any]:
+        """Get the driver pool backing this connection, if any."""
+        return None
+    
+    def set_pool(self, pool: Optional[Any]) -> None:
+        """Attach an existing driver pool (no-op for non-pooled connections)."""
+        pass
+    
+    def close_pool(self) -> None:
+        """Close the driver pool backing this connection (no-op for non-pooled connections)."""
+        pass
+    
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """
+        Check out a raw driver connection for the duration of a with-block.
+        
+        Yields:
+            Raw connection object (the current connection for non-pooled databases)
+        """
+        yield self.get_connection()
+    
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -104,3 +478,152 @@ class BaseDatabaseConnection(ABC):
         """Context manager exit."""
         self.disconnect()
 
+
+class _Transaction:
+    """Context manager returned by BaseDatabaseConnection.transaction()."""
+    
+    __slots__ = ("db",)
+    
+    def __init__(self, db: BaseDatabaseConnection):
+        self.db = db
+    
+    def __enter__(self) -> BaseDatabaseConnection:
+        if self.db._tx_depth == 0:
+            self.db._tx_failed = False
+            self.db._begin_transaction()
+        self.db._tx_depth += 1
+        return self.db
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.db._tx_depth -= 1
+        if self.db._tx_depth:
+            return False
+        try:
+            if exc_type is None and not self.db._tx_failed:
+                self.db.connection.commit()
+            else:
+                self.db.connection.rollback()
+        finally:
+            self.db._end_transaction()
+        return False
+
+
+class PooledDatabaseConnection(BaseDatabaseConnection):
+    """Base class for connections that check sessions out of a driver pool."""
+    
+    __slots__ = ("pool_size", "_pool", "_healthy_until", "_liveness_ttl")
+    
+    # Driver exceptions meaning the session itself is gone, not just the statement
+    DISCONNECT_ERRORS: tuple = ()
+    
+    def __init__(self, connection_name: str = "default", pool_size: int = 10):
+        """
+        Initialize pooled database connection.
+        
+        Args:
+            connection_name: Unique name for this connection
+            pool_size: Maximum number of sessions held by the pool
+        """
+        self.pool_size = pool_size
+        self._pool: Optional[Any] = None
+        # Liveness is trusted without a ping until _healthy_until (monotonic clock),
+        # which is pushed _liveness_ttl seconds (LXDB_LIVENESS_TTL_MS) past each successful ping
+        self._healthy_until = 0.0
+        self._liveness_ttl = settings.LIVENESS_TTL_MS / 1000
+        super().__init__(connection_name)
+    
+    @abstractmethod
+    def _create_pool(self) -> Any:
+        """Create the driver pool for this connection's DSN."""
+        pass
+    
+    @abstractmethod
+    def _acquire(self, pool: Any) -> Any:
+        """Check a raw connection out of the pool."""
+        pass
+    
+    @abstractmethod
+    def _release(self, pool: Any, conn: Any) -> None:
+        """Return a raw connection to the pool."""
+        pass
+    
+    @abstractmethod
+    def _close(self, pool: Any) -> None:
+        """Close every connection held by the pool."""
+        pass
+    
+    def _cached_liveness(self, ping: Callable[[], Any]) -> bool:
+        """Check liveness with ping(), skipping the round-trip while the last success is fresh."""
+        if self.connection is None:
+            return False
+        if time.monotonic() < self._healthy_until:
+            return True
+        try:
+            ping()
+        except Exception:
+            self._connected = False
+            return False
+        self._healthy_until = time.monotonic() + self._liveness_ttl
+        return True
+    
+    def _is_usable(self) -> bool:
+        """
+        Connection check run before each statement: the connected flag, re-validated with
+        is_connected() only on first use after connect() or after a driver error.
+        
+        A session that dies in between surfaces as a driver error on the statement itself,
+        which resets the check through _on_driver_error.
+        """
+        if not self._connected:
+            return False
+        return self._healthy_until > 0.0 or self.is_connected()
+    
+    def _invalidate_liveness(self) -> None:
+        """Force the next liveness check to ping, e.g. after a driver error."""
+        self._healthy_until = 0.0
+    
+    def _on_driver_error(self, exc: Exception) -> None:
+        """Invalidate cached liveness after a driver error, marking the connection lost if it was."""
+        self._record_error(exc)
+        self._healthy_until = 0.0
+        if isinstance(exc, self.DISCONNECT_ERRORS):
+            self._connected = False
+    
+    def _ensure_pool(self) -> Any:
+        """Get the driver pool, creating it (or joining the shared one) on first use."""
+        if self._pool is None:
+            key = self.get_pool_key() if self.SHARED_POOL else None
+            if key is None:
+                self._pool = self._create_pool()
+            else:
+                with _shared_pools_lock:
+                    pool = _shared_pools.get(key)
+                    if pool is None:
+                        pool = _shared_pools[key] = self._create_pool()
+                self._pool = pool
+        return self._pool
+    
+    def get_pool(self) -> Optional[Any]:
+        return self._pool
+    
+    def set_pool(self, pool: Optional[Any]) -> None:
+        self._pool = pool
+    
+    def close_pool(self) -> None:
+        if self._pool is not None:
+            with _shared_pools_lock:
+                key = self.get_pool_key()
+                if _shared_pools.get(key) is self._pool:
+                    del _shared_pools[key]
+            self._close(self._pool)
+            self._pool = None
+    
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        pool = self._ensure_pool()
+        conn = self._acquire(pool)
+        try:
+            yield conn
+        finally:
+            self._release(pool, conn)
+
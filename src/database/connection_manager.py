@@ -1,16 +1,53 @@
 """Manager for handling multiple database connections."""
 
-from typing import Dict, Optional, List
+import atexit
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, List
 from .base import BaseDatabaseConnection
 from .factory import DatabaseFactory
+from src.utils.log_helpers import get_logger
+
+logger = get_logger("lxdb.db")
+
+MAX_CLOSE_WORKERS = 32
+
+# Managers still alive, by id; weak values so registering a manager does not keep it alive
+_managers: "weakref.WeakValueDictionary[int, ConnectionManager]" = weakref.WeakValueDictionary()
+
+
+def _disconnect_at_exit() -> None:
+    """Disconnect the connections of every manager still alive at interpreter exit."""
+    for manager in list(_managers.values()):
+        manager.disconnect_all(parallel=False)
+
+
+# Release server-side sessions on interpreter exit; one hook for the process, not one per manager
+atexit.register(_disconnect_at_exit)
+
+
+def _run_all(func: Callable[[BaseDatabaseConnection], None], connections: List[BaseDatabaseConnection],
+             parallel: bool) -> None:
+    """Call func on every connection, on up to MAX_CLOSE_WORKERS threads when parallel."""
+    if not parallel:
+        for conn in connections:
+            func(conn)
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_CLOSE_WORKERS, len(connections))) as executor:
+        list(executor.map(func, connections))
 
 
 class ConnectionManager:
-    """Manages multiple database connections."""
+    """Manages multiple database connections and the pools they share."""
     
     def __init__(self):
         """Initialize the connection manager."""
         self.connections: Dict[str, BaseDatabaseConnection] = {}
+        # Driver pools keyed by (db_type, host, port, database, user), shared across connection names
+        self._pools: Dict[tuple, Any] = {}
+        # Connections stay strongly held: the manager is usually their only owner
+        _managers[id(self)] = self
     
     def add_connection(
         self,
@@ -47,7 +84,7 @@ class ConnectionManager:
             )
         """
         if name in self.connections:
-            print(f"✗ Connection '{name}' already exists. Use remove_connection() first.")
+            logger.error("✗ Connection '%s' already exists. Use remove_connection() first.", name)
             return False
         
         connection = DatabaseFactory.create(
@@ -57,6 +94,9 @@ class ConnectionManager:
         )
         
         if connection:
+            pool_key = connection.get_pool_key()
+            if pool_key in self._pools:
+                connection.set_pool(self._pools[pool_key])
             self.connections[name] = connection
             return True
         return False
@@ -85,9 +125,60 @@ class ConnectionManager:
         """
         connection = self.get_connection(name)
         if not connection:
-            print(f"✗ Connection '{name}' not found.")
+            logger.error("✗ Connection '%s' not found.", name)
+            return False
+        pool_key = connection.get_pool_key()
+        if pool_key in self._pools and connection.get_pool() is None:
+            connection.set_pool(self._pools[pool_key])
+        if not connection.connect():
             return False
-        return connection.connect()
+        if pool_key is not None:
+            self._pools.setdefault(pool_key, connection.get_pool())
+        return True
+    
+    @contextmanager
+    def checkout(self, name: str) -> Iterator[Any]:
+        """
+        Check out a raw pooled connection by connection name.
+        
+        Args:
+            name: Connection name
+            
+        Yields:
+            Raw driver connection, returned to its pool when the block exits
+            
+        Example:
+            with manager.checkout("mysql_main") as conn:
+                cursor = conn.cursor()
+        """
+        connection = self.get_connection(name)
+        if not connection:
+            raise KeyError(f"Connection '{name}' not found")
+        with connection.checkout() as conn:
+            yield conn
+    
+    async def aexecute_query(self, name: str, query: str) -> Optional[List]:
+        """
+        Execute a SELECT query on a named connection without blocking the event loop.
+        
+        Args:
+            name: Connection name
+            query: SQL query string
+            
+        Returns:
+            List of result rows or None if not found or on error
+            
+        Example:
+            results = await asyncio.gather(
+                manager.aexecute_query("oracle_main", "SELECT ..."),
+                manager.aexecute_query("mysql_main", "SELECT ..."),
+            )
+        """
+        connection = self.get_connection(name)
+        if not connection:
+            logger.error("✗ Connection '%s' not found.", name)
+            return None
+        return await connection.aexecute_query(query)
     
     def disconnect(self, name: str) -> None:
         """
@@ -100,10 +191,33 @@ class ConnectionManager:
         if connection:
             connection.disconnect()
     
-    def disconnect_all(self) -> None:
-        """Disconnect from all databases."""
-        for name in list(self.connections.keys()):
-            self.disconnect(name)
+    def disconnect_all(self, parallel: bool = True) -> None:
+        """
+        Disconnect from all databases and close the pools this manager shares between them.
+        
+        Process-wide pools (SHARED_POOL) are left open, since connections created outside
+        the manager for the same DSN and user may still be drawing from them.
+        
+        Args:
+            parallel: Close connections and pools concurrently; the atexit hook passes
+                False because no new threads can be started during interpreter shutdown
+        """
+        connections = list(self.connections.values())
+        if not connections:
+            return
+        _run_all(lambda conn: conn.disconnect(), connections, parallel)
+        
+        # Close each distinct manager-owned pool once through one of the connections that uses it
+        owners: Dict[int, BaseDatabaseConnection] = {}
+        for conn in connections:
+            if conn.get_pool() is not None and not conn.SHARED_POOL:
+                owners.setdefault(id(conn.get_pool()), conn)
+        if owners:
+            _run_all(lambda conn: conn.close_pool(), list(owners.values()), parallel)
+        for conn in connections:
+            if not conn.SHARED_POOL:
+                conn.set_pool(None)
+        self._pools.clear()
     
     def remove_connection(self, name: str) -> bool:
         """
@@ -119,9 +233,9 @@ class ConnectionManager:
         if connection:
             connection.disconnect()
             del self.connections[name]
-            print(f"✓ Connection '{name}' removed")
+            logger.info("✓ Connection '%s' removed", name)
             return True
-        print(f"✗ Connection '{name}' not found")
+        logger.error("✗ Connection '%s' not found", name)
         return False
     
     def list_connections(self) -> List[Dict]:
@@ -1,24 +1,41 @@
 """Factory for creating database connections."""
 
-from typing import Dict, Any, Optional
+import functools
+import importlib
+from typing import Dict, Any, Optional, Tuple
 from .base import BaseDatabaseConnection
-from .oracle_connection import OracleConnection
-from .mysql_connection import MySQLConnection
-from .sqlite_connection import SQLiteConnection
-from .postgres_connection import PostgreSQLConnection
+from src.utils.log_helpers import get_logger
+
+logger = get_logger("lxdb.db")
 
 
 class DatabaseFactory:
     """Factory class for creating database connections based on type."""
     
-    _connection_classes: Dict[str, type] = {
-        "oracle": OracleConnection,
-        "mysql": MySQLConnection,
-        "sqlite": SQLiteConnection,
-        "sqlite3": SQLiteConnection,
-        "postgres": PostgreSQLConnection,
-        "postgresql": PostgreSQLConnection,
+    # "module:Class" paths, imported on first use so only the drivers actually needed get loaded
+    _connection_paths: Dict[str, str] = {
+        "oracle": "src.database.oracle_connection:OracleConnection",
+        "mysql": "src.database.mysql_connection:MySQLConnection",
+        "sqlite": "src.database.sqlite_connection:SQLiteConnection",
+        "sqlite3": "src.database.sqlite_connection:SQLiteConnection",
+        "postgres": "src.database.postgres_connection:PostgreSQLConnection",
+        "postgresql": "src.database.postgres_connection:PostgreSQLConnection",
     }
+    _SUPPORTED_TUPLE: Tuple[str, ...] = tuple(_connection_paths)
+    _SUPPORTED_STR: str = ", ".join(_SUPPORTED_TUPLE)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _norm(db_type: str) -> str:
+        """Normalize a user-supplied database type name."""
+        return db_type.lower()
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolve(cls, key: str) -> type:
+        """Import and return the connection class registered for a normalized type key."""
+        module_path, class_name = cls._connection_paths[key].split(":")
+        return getattr(importlib.import_module(module_path), class_name)
     
     @classmethod
     def create(
@@ -74,23 +91,21 @@ class DatabaseFactory:
                 connection_name="postgres_main"
             )
         """
-        db_type_lower = db_type.lower()
+        db_type_lower = cls._norm(db_type)
         
-        if db_type_lower not in cls._connection_classes:
-            supported = ", ".join(cls._connection_classes.keys())
-            print(f"✗ Unsupported database type: {db_type}. Supported types: {supported}")
+        if db_type_lower not in cls._connection_paths:
+            logger.error("✗ Unsupported database type: %s. Supported types: %s", db_type, cls._SUPPORTED_STR)
             return None
         
-        connection_class = cls._connection_classes[db_type_lower]
-        
         try:
+            connection_class = cls._resolve(db_type_lower)
             return connection_class(connection_name=connection_name, **kwargs)
         except Exception as e:
-            print(f"✗ Error creating {db_type} connection: {str(e)}")
+            logger.error("✗ Error creating %s connection: %s", db_type, e)
             return None
     
     @classmethod
-    def get_supported_types(cls) -> list:
-        """Get list of supported database types."""
-        return list(cls._connection_classes.keys())
+    def get_supported_types(cls) -> Tuple[str, ...]:
+        """Get the supported database types."""
+        return cls._SUPPORTED_TUPLE
 
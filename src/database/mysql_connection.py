@@ -1,49 +1,130 @@
 """MySQL database connection implementation."""
 
+from collections import OrderedDict
 import mysql.connector
-from typing import Optional
-from .base import BaseDatabaseConnection
-from config.settings import MYSQL_HOST, MYSQL_PORT, MYSQL_DATABASE, MYSQL_USER, MYSQL_PASSWORD
-from src.utils.db_helpers import exec_query, exec_update, safe_disconnect, check_connection
+import mysql.connector.pooling
+from typing import Iterable, Iterator, Optional
+from .base import PooledDatabaseConnection, intern_config
+from config.settings import settings
+from src.utils.db_helpers import db_op, exec_query, iter_rows, exec_update, exec_many, is_ddl, safe_disconnect
+from src.utils.log_helpers import get_logger
 
+logger = get_logger("lxdb.db")
 
-class MySQLConnection(BaseDatabaseConnection):
-    """Handles MySQL database connections."""
+
+class MySQLConnection(PooledDatabaseConnection):
+    """Handles MySQL database connections backed by a connection pool."""
+    
+    __slots__ = ("host", "port", "database", "user", "password", "_conn_banner")
+    
+    DISCONNECT_ERRORS = (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError)
+    
+    PREPARED_CACHE_SIZE = 32
     
     def __init__(self, connection_name: str = "mysql_default", host: Optional[str] = None,
                  port: Optional[int] = None, database: Optional[str] = None,
-                 user: Optional[str] = None, password: Optional[str] = None, **kwargs):
-        self.host, self.port = host or MYSQL_HOST, port or MYSQL_PORT
-        self.database, self.user, self.password = database or MYSQL_DATABASE, user or MYSQL_USER, password or MYSQL_PASSWORD
-        super().__init__(connection_name, host=self.host, port=self.port, database=self.database,
-                        user=self.user, password=self.password, **kwargs)
+                 user: Optional[str] = None, password: Optional[str] = None, pool_size: int = 10, **kwargs):
+        self.host, self.port = intern_config(host, settings.MYSQL_HOST), port or settings.MYSQL_PORT
+        self.database, self.user, self.password = intern_config(database, settings.MYSQL_DATABASE), intern_config(user, settings.MYSQL_USER), password or settings.MYSQL_PASSWORD
+        self._conn_banner = f"MySQL database '{connection_name}': {self.host}:{self.port}/{self.database}"
+        super().__init__(connection_name, pool_size)
+    
+    def _public_config(self) -> dict:
+        return {"host": self.host, "port": self.port, "database": self.database, "user": self.user, "pool_size": self.pool_size}
+    
+    def get_pool_key(self) -> Optional[tuple]:
+        return ("mysql", self.host, self.port, self.database, self.user)
+    
+    def _create_pool(self) -> mysql.connector.pooling.MySQLConnectionPool:
+        return mysql.connector.pooling.MySQLConnectionPool(
+            pool_name=self.connection_name, pool_size=self.pool_size, pool_reset_session=True,
+            host=self.host, port=self.port, database=self.database, user=self.user, password=self.password,
+            use_pure=False)  # C-extension protocol implementation
+    
+    def _acquire(self, pool) -> mysql.connector.pooling.PooledMySQLConnection:
+        return pool.get_connection()
     
+    def _release(self, pool, conn) -> None:
+        conn.close()  # close() on a pooled connection returns it to the pool
+    
+    def _close(self, pool) -> None:
+        # Check each idle connection out and disconnect it rather than handing it back;
+        # bounded by the pool size since a connection that fails to reconnect is re-queued
+        for _ in range(pool.pool_size):
+            try:
+                conn = pool.get_connection()
+            except mysql.connector.errors.PoolError:
+                break
+            except mysql.connector.Error:
+                continue
+            try:
+                conn.disconnect()
+            except mysql.connector.Error:
+                pass
+    
+    @db_op("MySQL", mysql.connector.Error, default=False)
     def connect(self) -> bool:
-        try:
-            self.connection = mysql.connector.connect(host=self.host, port=self.port, database=self.database,
-                                                     user=self.user, password=self.password)
-            print(f"✓ Successfully connected to MySQL database '{self.connection_name}': {self.host}:{self.port}/{self.database}")
-            return True
-        except Exception as e:
-            print(f"✗ MySQL database error ({self.connection_name}): {str(e)}")
-            return False
+        self.connection = self._acquire(self._ensure_pool())
+        self._connected = True
+        logger.info("✓ Successfully connected to %s", self._conn_banner)
+        return True
+    
+    def _new_cursor(self) -> mysql.connector.cursor.MySQLCursor:
+        # Buffered so a new statement can run on the reused cursor without draining the previous result
+        return self.connection.cursor(buffered=True)
+    
+    def _prepared_cursor(self, query: str) -> mysql.connector.cursor.MySQLCursorPrepared:
+        # Per thread, like _cursor(): query text -> prepared cursor, LRU-ordered
+        prepared = getattr(self._cursor_tls, "prepared", None)
+        if prepared is None:
+            prepared = self._cursor_tls.prepared = OrderedDict()
+        cursor = prepared.get(query)
+        if cursor is None:
+            # Binary-protocol prepared statement: the server parses the SQL once per session
+            cursor = prepared[query] = self._track_cursor(self.connection.cursor(prepared=True))
+            if len(prepared) > self.PREPARED_CACHE_SIZE:
+                self._close_cursor(prepared.popitem(last=False)[1])
+        else:
+            prepared.move_to_end(query)
+        return cursor
     
     def disconnect(self) -> None:
-        safe_disconnect(self.connection, lambda: self.connection.close() if self.connection.is_connected() else None,
-                       self.connection_name, "MySQL")
+        self._drop_cursor()
+        safe_disconnect(self.connection, lambda: self._release(self._pool, self.connection), self.connection_name, "MySQL")
         self.connection = None
+        self._connected = False
+        self._invalidate_liveness()
     
     def is_connected(self) -> bool:
-        return check_connection(self.connection, lambda: self.connection.is_connected())
+        return self._cached_liveness(lambda: self.connection.ping())
     
-    def get_connection(self) -> Optional[mysql.connector.MySQLConnection]:
+    def get_connection(self) -> Optional[mysql.connector.pooling.PooledMySQLConnection]:
         return self.connection if self.is_connected() else None
     
     def execute_query(self, query: str) -> Optional[list]:
-        return exec_query(self.connection, lambda: self.connection.cursor(), self.is_connected,
-                         self.connection_name, "MySQL", query)
+        return exec_query(self.connection, self._cursor, self._is_usable,
+                         self.connection_name, "MySQL", query, close_cursor=False, on_error=self._on_driver_error)
+    
+    def iter_query(self, query: str, arraysize: int = 10000) -> Iterator[tuple]:
+        # Unbuffered cursor so rows stream from the server instead of being read up front
+        yield from iter_rows(self.connection, lambda: self.connection.cursor(buffered=False), self._is_usable,
+                             self.connection_name, "MySQL", query, arraysize, on_error=self._on_driver_error)
     
     def execute_update(self, query: str, params: Optional[tuple] = None) -> bool:
-        return exec_update(self.connection, lambda: self.connection.cursor(), lambda: self.connection.commit(),
-                          lambda: self.connection.rollback(), self.is_connected, self.connection_name,
-                          "MySQL", query, params)
+        ok = exec_update(self.connection, lambda: self._prepared_cursor(query), self._commit,
+                        self._rollback, self._is_usable, self.connection_name,
+                        "MySQL", query, params, close_cursor=False, on_error=self._on_driver_error)
+        if ok and is_ddl(query):
+            self._after_ddl()
+        return ok
+    
+    def clear_statement_cache(self) -> None:
+        # This thread's prepared cursors; other threads may be mid-statement on theirs
+        for cursor in getattr(self._cursor_tls, "prepared", {}).values():
+            self._close_cursor(cursor)
+        self._cursor_tls.prepared = OrderedDict()
+    
+    def execute_many(self, query: str, params_seq: Iterable[tuple], chunk_size: int = 1000) -> int:
+        return exec_many(self.connection, self._cursor, self._commit,
+                        self._rollback, self._is_usable, self.connection_name,
+                        "MySQL", query, params_seq, chunk_size, close_cursor=False, on_error=self._on_driver_error)
@@ -1,63 +1,197 @@
 """Oracle database connection implementation."""
 
+import threading
+from collections import OrderedDict
 import oracledb
-from typing import Optional
-from .base import BaseDatabaseConnection
-from config.settings import ORACLE_HOST, ORACLE_PORT, ORACLE_SID, ORACLE_USER, ORACLE_PASSWORD
-from src.utils.db_helpers import exec_query, exec_update, safe_disconnect, check_connection
+from typing import Dict, Iterable, Iterator, List, Optional
+from .base import PooledDatabaseConnection, intern_config
+from config.settings import settings
+from src.utils.db_helpers import db_op, exec_query, exec_query_one, iter_rows, exec_update, exec_many, is_ddl, safe_disconnect
+from src.utils.log_helpers import get_logger
 
-# Initialize thick mode to support all password verifier types
-try:
-    oracledb.init_oracle_client()
-except Exception:
-    pass  # Thick mode already initialized or client not available
+logger = get_logger("lxdb.db")
 
+# Fetch CLOB/BLOB columns as str/bytes directly instead of LOB locators that need extra round-trips
+oracledb.defaults.fetch_lobs = False
 
-class OracleConnection(BaseDatabaseConnection):
-    """Handles Oracle database connections."""
+# Thick mode (to support all password verifier types) is initialized when the first session
+# pool is created, so processes that never open an Oracle session skip loading the Instant Client.
+# With ORACLE_THICK_MODE=false the pure-Python thin driver is used instead.
+_thick_init_lock = threading.Lock()
+_thick_initialized = False
+
+
+def _init_thick_mode() -> None:
+    """Initialize oracledb thick mode once per process."""
+    global _thick_initialized
+    if not settings.ORACLE_THICK_MODE:
+        return
+    with _thick_init_lock:
+        if not _thick_initialized:
+            try:
+                oracledb.init_oracle_client()
+            except Exception:
+                pass  # Thick mode already initialized or client not available
+            _thick_initialized = True
+
+
+class OracleConnection(PooledDatabaseConnection):
+    """Handles Oracle database connections backed by a session pool."""
+    
+    __slots__ = ("host", "port", "sid", "user", "password", "_autocommit", "_dsn", "_conn_banner")
+    
+    DISCONNECT_ERRORS = (oracledb.OperationalError, oracledb.InterfaceError)
+    SHARED_POOL = True  # every OracleConnection for the same DSN and user draws from one session pool
+    CURSOR_CACHE_SIZE = 32
+    QUERY_ARRAYSIZE = 1000  # rows per round-trip for execute_query (driver default is 100)
     
     def __init__(self, connection_name: str = "oracle_default", host: Optional[str] = None,
                  port: Optional[int] = None, sid: Optional[str] = None,
-                 user: Optional[str] = None, password: Optional[str] = None, **kwargs):
-        self.host, self.port, self.sid = host or ORACLE_HOST, port or ORACLE_PORT, sid or ORACLE_SID
-        self.user, self.password = user or ORACLE_USER, password or ORACLE_PASSWORD
-        super().__init__(connection_name, host=self.host, port=self.port, sid=self.sid,
-                        user=self.user, password=self.password, **kwargs)
+                 user: Optional[str] = None, password: Optional[str] = None, pool_size: Optional[int] = None, **kwargs):
+        self.host, self.port, self.sid = intern_config(host, settings.ORACLE_HOST), port or settings.ORACLE_PORT, intern_config(sid, settings.ORACLE_SID)
+        self.user, self.password = intern_config(user, settings.ORACLE_USER), password or settings.ORACLE_PASSWORD
+        self._dsn = oracledb.makedsn(self.host, self.port, sid=self.sid)
+        self._conn_banner = f"Oracle database '{connection_name}': {self.host}:{self.port}/{self.sid}"
+        super().__init__(connection_name, pool_size or settings.ORACLE_POOL_MAX)
+        self._autocommit = False
+    
+    def _public_config(self) -> dict:
+        return {"host": self.host, "port": self.port, "sid": self.sid, "user": self.user, "pool_size": self.pool_size}
+    
+    def get_pool_key(self) -> Optional[tuple]:
+        return ("oracle", self.host, self.port, self.sid, self.user)
+    
+    def _create_pool(self) -> oracledb.ConnectionPool:
+        # Every session comes from a pool, whether via connect() or checkout(), so thick mode
+        # is set up here; the driver mode must be chosen before the first pool exists
+        _init_thick_mode()
+        return oracledb.create_pool(user=self.user, password=self.password,
+                                    dsn=self._dsn,
+                                    min=min(settings.ORACLE_POOL_MIN, self.pool_size), max=self.pool_size, increment=1, homogeneous=True,
+                                    stmtcachesize=settings.ORACLE_STMT_CACHE_SIZE)  # reuse parsed statements for repeated SQL text
+    
+    def _acquire(self, pool) -> oracledb.Connection:
+        return pool.acquire()
+    
+    def _release(self, pool, conn) -> None:
+        pool.release(conn)
     
+    def _close(self, pool) -> None:
+        pool.close(force=True)
+    
+    def _begin_transaction(self) -> None:
+        self._autocommit = self.connection.autocommit
+        self.connection.autocommit = False
+    
+    def _end_transaction(self) -> None:
+        self.connection.autocommit = self._autocommit
+    
+    @db_op("Oracle", oracledb.Error, default=False)
     def connect(self) -> bool:
-        try:
-            self.connection = oracledb.connect(user=self.user, password=self.password,
-                                             dsn=oracledb.makedsn(self.host, self.port, sid=self.sid))
-            print(f"✓ Successfully connected to Oracle database '{self.connection_name}': {self.host}:{self.port}/{self.sid}")
-            return True
-        except Exception as e:
-            print(f"✗ Oracle database error ({self.connection_name}): {str(e)}")
-            return False
+        self.connection = self._acquire(self._ensure_pool())
+        self._connected = True
+        logger.info("✓ Successfully connected to %s", self._conn_banner)
+        return True
+    
+    def _statement_cursor(self, query: str) -> oracledb.Cursor:
+        # Per thread, like _cursor(): DML text -> reusable cursor, LRU-ordered
+        cursors = getattr(self._cursor_tls, "statements", None)
+        if cursors is None:
+            cursors = self._cursor_tls.statements = OrderedDict()
+        cursor = cursors.get(query)
+        if cursor is None:
+            cursor = cursors[query] = self._track_cursor(self.connection.cursor())
+            if len(cursors) > self.CURSOR_CACHE_SIZE:
+                self._close_cursor(cursors.popitem(last=False)[1])
+        else:
+            cursors.move_to_end(query)
+        return cursor
     
     def disconnect(self) -> None:
-        safe_disconnect(self.connection, lambda: self.connection.close(), self.connection_name, "Oracle")
+        self._drop_cursor()
+        # Release the session back to the pool instead of logging off
+        safe_disconnect(self.connection, lambda: self._release(self._pool, self.connection), self.connection_name, "Oracle")
         self.connection = None
+        self._connected = False
+        self._invalidate_liveness()
     
     def is_connected(self) -> bool:
-        try:
-            if self.connection:
-                # Try a simple query to check connection
-                cursor = self.connection.cursor()
-                cursor.execute("SELECT 1 FROM DUAL")
-                cursor.close()
-                return True
-            return False
-        except Exception:
-            return False
+        return self._cached_liveness(lambda: self.connection.ping())
     
     def get_connection(self) -> Optional[oracledb.Connection]:
         return self.connection if self.is_connected() else None
     
-    def execute_query(self, query: str) -> Optional[list]:
-        return exec_query(self.connection, lambda: self.connection.cursor(), self.is_connected,
-                         self.connection_name, "Oracle", query)
+    def execute_query(self, query: str, arraysize: Optional[int] = None) -> Optional[list]:
+        # Runs on this thread's reusable cursor; the session's statement cache (stmtcachesize) skips re-parsing
+        arraysize = arraysize or self.QUERY_ARRAYSIZE
+        return exec_query(self.connection, lambda: self._query_cursor(arraysize), self._is_usable,
+                         self.connection_name, "Oracle", query, close_cursor=False, on_error=self._on_driver_error,
+                         arraysize=arraysize)
+    
+    def execute_query_one(self, query: str) -> Optional[tuple]:
+        return exec_query_one(self.connection, lambda: self._query_cursor(1), self._is_usable,
+                              self.connection_name, "Oracle", query, close_cursor=False, on_error=self._on_driver_error)
+    
+    def _query_cursor(self, arraysize: int) -> oracledb.Cursor:
+        cursor = self._cursor()
+        # Prefetch one row beyond arraysize so the first fetch needs no extra round-trip
+        cursor.prefetchrows = arraysize + 1
+        return cursor
+    
+    def iter_query(self, query: str, arraysize: int = 10000) -> Iterator[tuple]:
+        yield from iter_rows(self.connection, lambda: self._streaming_cursor(arraysize), self._is_usable,
+                             self.connection_name, "Oracle", query, arraysize, on_error=self._on_driver_error)
+    
+    def _streaming_cursor(self, arraysize: int) -> oracledb.Cursor:
+        cursor = self.connection.cursor()
+        # Prefetch one row beyond arraysize so the first fetch needs no extra round-trip
+        cursor.prefetchrows = arraysize + 1
+        return cursor
     
     def execute_update(self, query: str, params: Optional[tuple] = None) -> bool:
-        return exec_update(self.connection, lambda: self.connection.cursor(), lambda: self.connection.commit(),
-                          lambda: self.connection.rollback(), self.is_connected, self.connection_name,
-                          "Oracle", query, params)
+        # One long-lived cursor per statement text, so repeated DML skips cursor setup
+        ok = exec_update(self.connection, lambda: self._statement_cursor(query), self._commit,
+                        self._rollback, self._is_usable, self.connection_name,
+                        "Oracle", query, params, close_cursor=False, on_error=self._on_driver_error)
+        if ok and is_ddl(query):
+            self._after_ddl()
+        return ok
+    
+    def clear_statement_cache(self) -> None:
+        # This thread's cached DML cursors; other threads may be mid-statement on theirs
+        for cursor in getattr(self._cursor_tls, "statements", {}).values():
+            self._close_cursor(cursor)
+        self._cursor_tls.statements = OrderedDict()
+    
+    def execute_many(self, query: str, params_seq: Iterable[tuple], chunk_size: int = 1000,
+                     failed_rows: Optional[Dict[int, str]] = None) -> int:
+        # Rejected rows come back as batch errors instead of failing the call;
+        # failed_rows, if given, maps their positions in params_seq to the error message
+        offset = 0
+        
+        def run_chunk(cursor, query: str, chunk: List[tuple]) -> int:
+            nonlocal offset
+            executed = self._executemany_chunk(cursor, query, chunk, offset, failed_rows)
+            offset += len(chunk)
+            return executed
+        
+        return exec_many(self.connection, self._cursor, self._commit,
+                        self._rollback, self._is_usable, self.connection_name,
+                        "Oracle", query, params_seq, chunk_size, executemany_func=run_chunk,
+                        close_cursor=False, on_error=self._on_driver_error)
+    
+    def _executemany_chunk(self, cursor, query: str, chunk: List[tuple], offset: int = 0,
+                           failed_rows: Optional[Dict[int, str]] = None) -> int:
+        # Declare bind types from the first row so the driver skips per-row type probing
+        if isinstance(chunk[0], (tuple, list)):
+            cursor.setinputsizes(*(type(value) if value is not None else None for value in chunk[0]))
+        cursor.executemany(query, chunk, batcherrors=True)
+        errors = cursor.getbatcherrors()
+        if errors:
+            # One record per chunk; the per-row messages go to failed_rows for the caller to aggregate
+            logger.error("✗ Oracle batch errors (%s): %d of %d rows rejected, first at row %s: %s",
+                         self.connection_name, len(errors), len(chunk), offset + errors[0].offset, errors[0].message)
+            if failed_rows is not None:
+                for error in errors:
+                    failed_rows[offset + error.offset] = error.message
+        return len(chunk) - len(errors)
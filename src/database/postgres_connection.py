@@ -1,48 +1,175 @@
 """PostgreSQL database connection implementation."""
 
+import itertools
+import re
+import weakref
 import psycopg2
-from typing import Optional
-from .base import BaseDatabaseConnection
-from config.settings import POSTGRES_HOST, POSTGRES_PORT, POSTGRES_DATABASE, POSTGRES_USER, POSTGRES_PASSWORD
-from src.utils.db_helpers import exec_query, exec_update, safe_disconnect, check_connection
+import psycopg2.errors
+import psycopg2.extras
+import psycopg2.pool
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from .base import PooledDatabaseConnection, intern_config
+from config.settings import settings
+from src.utils.db_helpers import db_op, exec_query, iter_rows, exec_update, exec_many, is_ddl, safe_disconnect
+from src.utils.log_helpers import get_logger
 
+logger = get_logger("lxdb.db")
 
-class PostgreSQLConnection(BaseDatabaseConnection):
-    """Handles PostgreSQL database connections."""
+# Server-side prepared statements live as long as the session, so track them per raw
+# connection (pooled sessions outlive any one PostgreSQLConnection): query text -> name
+_session_statements: "weakref.WeakKeyDictionary[psycopg2.extensions.connection, Dict[str, str]]" = weakref.WeakKeyDictionary()
+_statement_ids = itertools.count()
+_stream_cursor_ids = itertools.count()
+_PLACEHOLDER = re.compile(r"%[s%]")
+
+
+def _to_server_placeholders(query: str) -> str:
+    """Rewrite psycopg2 %s placeholders as PREPARE-style $1, $2, ..."""
+    position = 0
+    
+    def replace(match: re.Match) -> str:
+        nonlocal position
+        if match.group() == "%%":
+            return "%"
+        position += 1
+        return f"${position}"
+    
+    return _PLACEHOLDER.sub(replace, query)
+
+
+class PostgreSQLConnection(PooledDatabaseConnection):
+    """Handles PostgreSQL database connections backed by a thread-safe connection pool."""
+    
+    __slots__ = ("host", "port", "database", "user", "password", "_conn_banner")
+    
+    DISCONNECT_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+    SHARED_POOL = True  # every PostgreSQLConnection for the same server, database and user shares one pool
     
     def __init__(self, connection_name: str = "postgres_default", host: Optional[str] = None,
                  port: Optional[int] = None, database: Optional[str] = None,
-                 user: Optional[str] = None, password: Optional[str] = None, **kwargs):
-        self.host, self.port = host or POSTGRES_HOST, port or POSTGRES_PORT
-        self.database, self.user, self.password = database or POSTGRES_DATABASE, user or POSTGRES_USER, password or POSTGRES_PASSWORD
-        super().__init__(connection_name, host=self.host, port=self.port, database=self.database,
-                        user=self.user, password=self.password, **kwargs)
+                 user: Optional[str] = None, password: Optional[str] = None, pool_size: Optional[int] = None, **kwargs):
+        self.host, self.port = intern_config(host, settings.POSTGRES_HOST), port or settings.POSTGRES_PORT
+        self.database, self.user, self.password = intern_config(database, settings.POSTGRES_DATABASE), intern_config(user, settings.POSTGRES_USER), password or settings.POSTGRES_PASSWORD
+        self._conn_banner = f"PostgreSQL database '{connection_name}': {self.host}:{self.port}/{self.database}"
+        super().__init__(connection_name, pool_size or settings.PG_POOL_MAX)
+    
+    def _public_config(self) -> dict:
+        return {"host": self.host, "port": self.port, "database": self.database, "user": self.user, "pool_size": self.pool_size}
+    
+    def get_pool_key(self) -> Optional[tuple]:
+        return ("postgres", self.host, self.port, self.database, self.user)
+    
+    def _create_pool(self) -> psycopg2.pool.ThreadedConnectionPool:
+        return psycopg2.pool.ThreadedConnectionPool(min(settings.PG_POOL_MIN, self.pool_size), self.pool_size,
+                                                    host=self.host, port=self.port, database=self.database,
+                                                    user=self.user, password=self.password)
     
+    def _acquire(self, pool) -> psycopg2.extensions.connection:
+        return pool.getconn()
+    
+    def _release(self, pool, conn) -> None:
+        pool.putconn(conn)
+    
+    def _close(self, pool) -> None:
+        pool.closeall()
+    
+    @db_op("PostgreSQL", psycopg2.Error, default=False)
     def connect(self) -> bool:
-        try:
-            self.connection = psycopg2.connect(host=self.host, port=self.port, database=self.database,
-                                              user=self.user, password=self.password)
-            print(f"✓ Successfully connected to PostgreSQL database '{self.connection_name}': {self.host}:{self.port}/{self.database}")
-            return True
-        except Exception as e:
-            print(f"✗ PostgreSQL database error ({self.connection_name}): {str(e)}")
-            return False
+        self.connection = self._acquire(self._ensure_pool())
+        self._connected = True
+        logger.info("✓ Successfully connected to %s", self._conn_banner)
+        return True
     
     def disconnect(self) -> None:
-        safe_disconnect(self.connection, lambda: self.connection.close(), self.connection_name, "PostgreSQL")
+        self._drop_cursor()
+        # Return the connection to the pool instead of closing the socket
+        safe_disconnect(self.connection, lambda: self._release(self._pool, self.connection), self.connection_name, "PostgreSQL")
         self.connection = None
+        self._connected = False
     
     def is_connected(self) -> bool:
-        return check_connection(self.connection, lambda: (c := self.connection.cursor(), c.execute("SELECT 1"), c.close()) or True)
+        # closed is tracked client-side by libpq, so this costs no round-trip; a dead socket surfaces as a driver error
+        return self.connection is not None and self.connection.closed == 0
     
     def get_connection(self) -> Optional[psycopg2.extensions.connection]:
         return self.connection if self.is_connected() else None
     
     def execute_query(self, query: str) -> Optional[list]:
-        return exec_query(self.connection, lambda: self.connection.cursor(), self.is_connected,
-                         self.connection_name, "PostgreSQL", query)
+        return exec_query(self.connection, self._cursor, self.is_connected,
+                         self.connection_name, "PostgreSQL", query, close_cursor=False, on_error=self._on_driver_error)
+    
+    def iter_query(self, query: str, arraysize: int = 2000) -> Iterator[tuple]:
+        # A named (server-side) cursor streams arraysize rows per fetch instead of buffering the
+        # whole result client-side; it lives inside a transaction, ended here unless one is open
+        try:
+            yield from iter_rows(self.connection, lambda: self._server_cursor(arraysize), self.is_connected,
+                                 self.connection_name, "PostgreSQL", query, arraysize, on_error=self._on_driver_error)
+        finally:
+            if self.connection is not None and not self.connection.closed and not self.connection.autocommit:
+                self._commit()
+    
+    def _server_cursor(self, itersize: int) -> psycopg2.extensions.cursor:
+        cursor = self.connection.cursor(name=f"lxdb_stream_{next(_stream_cursor_ids)}")
+        cursor.itersize = itersize
+        return cursor
     
     def execute_update(self, query: str, params: Optional[tuple] = None) -> bool:
-        return exec_update(self.connection, lambda: self.connection.cursor(), lambda: self.connection.commit(),
-                          lambda: self.connection.rollback(), self.is_connected, self.connection_name,
-                          "PostgreSQL", query, params)
+        if not isinstance(params, (tuple, list)) or not params or self.connection is None:
+            ok = exec_update(self.connection, self._cursor, self._commit,
+                            self._rollback, self.is_connected, self.connection_name,
+                            "PostgreSQL", query, params, close_cursor=False, on_error=self._on_driver_error)
+            if ok and is_ddl(query):
+                self._after_ddl()
+            return ok
+        # Positional updates run as server-side prepared statements, parsed once per session
+        execute_sql, cursor_func = self._prepared(query, len(params))
+        conn = self.connection
+        
+        def on_error(exc: Exception) -> None:
+            # A session that lost the statement (e.g. server-side DISCARD) re-prepares next time
+            if isinstance(exc, psycopg2.errors.InvalidSqlStatementName):
+                _session_statements.get(conn, {}).pop(query, None)
+            self._on_driver_error(exc)
+        
+        return exec_update(self.connection, cursor_func, self._commit,
+                          self._rollback, self.is_connected, self.connection_name,
+                          "PostgreSQL", execute_sql, params, close_cursor=False, on_error=on_error)
+    
+    def clear_statement_cache(self) -> None:
+        # Prepared SELECTs fail with "cached plan must not change result type" once a table they read changes
+        statements = _session_statements.pop(self.connection, None) if self.connection is not None else None
+        if statements:
+            try:
+                self._cursor().execute("DEALLOCATE ALL")
+                self._commit()
+            except psycopg2.Error as e:
+                self._on_driver_error(e)
+    
+    def _prepared(self, query: str, param_count: int) -> Tuple[str, Callable]:
+        conn = self.connection
+        statements = _session_statements.setdefault(conn, {})
+        name = statements.get(query)
+        pending = name is None
+        if pending:
+            name = f"lxdb_stmt_{next(_statement_ids)}"
+        
+        def cursor_func():
+            cursor = self._cursor()
+            if pending and query not in statements:
+                cursor.execute(f"PREPARE {name} AS {_to_server_placeholders(query)}")
+                statements[query] = name
+            return cursor
+        
+        return f"EXECUTE {name} ({', '.join(['%s'] * param_count)})", cursor_func
+    
+    def execute_many(self, query: str, params_seq: Iterable[tuple], chunk_size: int = 1000) -> int:
+        return exec_many(self.connection, self._cursor, self._commit,
+                        self._rollback, self.is_connected, self.connection_name,
+                        "PostgreSQL", query, params_seq, chunk_size, executemany_func=self._execute_batch,
+                        close_cursor=False, on_error=self._on_driver_error)
+    
+    @staticmethod
+    def _execute_batch(cursor, query: str, chunk: List[tuple]) -> int:
+        # execute_batch joins many statements per round-trip and, unlike execute_values, works for any DML
+        psycopg2.extras.execute_batch(cursor, query, chunk, page_size=len(chunk))
+        return len(chunk)
@@ -1,45 +1,91 @@
 """SQLite3 database connection implementation."""
 
 import sqlite3
-from typing import Optional
-from .base import BaseDatabaseConnection
-from config.settings import SQLITE_DATABASE
-from src.utils.db_helpers import exec_query, exec_update, safe_disconnect, check_connection
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from .base import BaseDatabaseConnection, intern_config
+from config.settings import settings
+from src.utils.db_helpers import db_op, exec_query, iter_rows, exec_update, exec_many, is_ddl, safe_disconnect
+from src.utils.log_helpers import get_logger
+
+logger = get_logger("lxdb.db")
 
 
 class SQLiteConnection(BaseDatabaseConnection):
     """Handles SQLite3 database connections."""
     
+    __slots__ = ("database",)
+    
+    # Applied on every connect: WAL lets readers run alongside a writer, synchronous=NORMAL
+    # drops the per-commit fsync (safe under WAL), and mmap/cache keep reads out of syscalls
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-65536",
+    )
+    
     def __init__(self, connection_name: str = "sqlite_default", database: Optional[str] = None, **kwargs):
-        self.database = database or SQLITE_DATABASE
-        super().__init__(connection_name, database=self.database, **kwargs)
+        self.database = intern_config(database, settings.SQLITE_DATABASE)
+        super().__init__(connection_name)
+    
+    def _public_config(self) -> dict:
+        return {"database": self.database}
     
+    @db_op("SQLite3", sqlite3.Error, default=False)
     def connect(self) -> bool:
-        try:
-            self.connection = sqlite3.connect(self.database, check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row
-            print(f"✓ Successfully connected to SQLite3 database '{self.connection_name}': {self.database}")
-            return True
-        except Exception as e:
-            print(f"✗ SQLite3 database error ({self.connection_name}): {str(e)}")
-            return False
+        self.connection = sqlite3.connect(self.database, check_same_thread=False)
+        for pragma in self.PRAGMAS:
+            self.connection.execute(pragma)
+        self._connected = True
+        logger.info("✓ Successfully connected to SQLite3 database '%s': %s", self.connection_name, self.database)
+        return True
     
     def disconnect(self) -> None:
+        self._drop_cursor()
         safe_disconnect(self.connection, lambda: self.connection.close(), self.connection_name, "SQLite3")
         self.connection = None
+        self._connected = False
     
     def is_connected(self) -> bool:
-        return check_connection(self.connection, lambda: self.connection.execute("SELECT 1"))
+        # An open sqlite3 connection cannot drop out from under us, so there is nothing to probe
+        return self.connection is not None
     
     def get_connection(self) -> Optional[sqlite3.Connection]:
         return self.connection if self.is_connected() else None
     
     def execute_query(self, query: str) -> Optional[list]:
-        results = exec_query(self.connection, lambda: self.connection.cursor(), self.is_connected,
-                            self.connection_name, "SQLite3", query)
-        return [tuple(row) for row in results] if results else None
+        # No row_factory is set, so sqlite3 already returns plain tuples
+        return exec_query(self.connection, self._cursor, self.is_connected,
+                         self.connection_name, "SQLite3", query, close_cursor=False, on_error=self._record_error)
+    
+    def execute_query_dict(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        results = exec_query(self.connection, self._row_cursor, self.is_connected,
+                            self.connection_name, "SQLite3", query, close_cursor=False, on_error=self._record_error)
+        return [dict(row) for row in results] if results is not None else None
+    
+    def _row_cursor(self) -> sqlite3.Cursor:
+        # Named access is opt-in per cursor so plain queries keep the cheap tuple rows; like
+        # _cursor() it is kept per thread and closed by _drop_cursor() on disconnect
+        cursor = getattr(self._cursor_tls, "row_cursor", None)
+        if cursor is None:
+            cursor = self._cursor_tls.row_cursor = self._track_cursor(self.connection.cursor())
+            cursor.row_factory = sqlite3.Row
+        return cursor
+    
+    def iter_query(self, query: str, arraysize: int = 10000) -> Iterator[tuple]:
+        yield from iter_rows(self.connection, lambda: self.connection.cursor(), self.is_connected,
+                             self.connection_name, "SQLite3", query, arraysize)
     
     def execute_update(self, query: str, params: Optional[tuple] = None) -> bool:
-        return exec_update(self.connection, lambda: self.connection.cursor(), lambda: self.connection.commit(),
-                          lambda: self.connection.rollback(), self.is_connected, self.connection_name,
-                          "SQLite3", query, params)
+        ok = exec_update(self.connection, self._cursor, self._commit,
+                        self._rollback, self.is_connected, self.connection_name,
+                        "SQLite3", query, params, close_cursor=False, on_error=self._record_error)
+        if ok and is_ddl(query):
+            self._after_ddl()
+        return ok
+    
+    def execute_many(self, query: str, params_seq: Iterable[tuple], chunk_size: int = 1000) -> int:
+        return exec_many(self.connection, self._cursor, self._commit,
+                        self._rollback, self.is_connected, self.connection_name,
+                        "SQLite3", query, params_seq, chunk_size, close_cursor=False, on_error=self._record_error)
@@ -1,16 +1,91 @@
 """Main reconciliation orchestrator for receipts."""
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import logging
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import count, islice
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from src.database import OracleConnection
 from src.features.reconciliation.receipts.extractor import ReceiptExtractor
 from src.features.reconciliation.receipts.validator import ReceiptValidator
 from src.models.receipt import Receipt
+from src.utils.log_helpers import get_logger
 from config.reconciliation_config import (
     MIN_CONFIDENCE_SCORE,
     AUTO_RECONCILE_THRESHOLD,
     ENABLE_AUTO_RECONCILE,
+    VALIDATION_WORKERS,
+    UPDATE_WORKERS,
+    UPDATE_BATCH_SIZE,
 )
 
+logger = get_logger("lxdb.reconciliation")
+
+
+UPDATE_STATUS_QUERY = """
+    UPDATE CFMSPRO.RECEIPT_DETAILS
+    SET STATUS = :new_status,
+        UPDATED_AT = SYSTIMESTAMP,
+        RECONCILED_AT = SYSTIMESTAMP,
+        RECONCILED_BY = 'SYSTEM'
+    WHERE ID = :receipt_id
+"""
+UPDATE_STATUS_STATEMENT = "update_receipt_status"
+
+# Reconciling is by far the most common update, so it gets its own statement with the status
+# as a literal: only the ID is bound, giving Oracle one stable cursor and plan for the hot path
+RECONCILED_STATUS = "R"
+RECONCILE_QUERY = """
+    UPDATE CFMSPRO.RECEIPT_DETAILS
+    SET STATUS = 'R',
+        UPDATED_AT = SYSTIMESTAMP,
+        RECONCILED_AT = SYSTIMESTAMP,
+        RECONCILED_BY = 'SYSTEM'
+    WHERE ID = :receipt_id
+"""
+RECONCILE_STATEMENT = "reconcile_receipt"
+
+# One statement per status for a whole list of IDs; the IDs are bound as a SQL collection
+# and the rows actually updated come back through RETURNING
+FUSED_UPDATE_STATUS_QUERY = """
+    UPDATE CFMSPRO.RECEIPT_DETAILS
+    SET STATUS = :new_status,
+        UPDATED_AT = SYSTIMESTAMP,
+        RECONCILED_AT = SYSTIMESTAMP,
+        RECONCILED_BY = 'SYSTEM'
+    WHERE ID IN (SELECT COLUMN_VALUE FROM TABLE(:receipt_ids))
+    RETURNING ID INTO :updated_ids
+"""
+FUSED_RECONCILE_QUERY = """
+    UPDATE CFMSPRO.RECEIPT_DETAILS
+    SET STATUS = 'R',
+        UPDATED_AT = SYSTIMESTAMP,
+        RECONCILED_AT = SYSTIMESTAMP,
+        RECONCILED_BY = 'SYSTEM'
+    WHERE ID IN (SELECT COLUMN_VALUE FROM TABLE(:receipt_ids))
+    RETURNING ID INTO :updated_ids
+"""
+ID_LIST_TYPE = "SYS.ODCINUMBERLIST"
+FUSED_UPDATE_CHUNK_SIZE = 1000
+
+# Errors reported for updates that failed without a driver error message
+NO_CONNECTION_ERROR = "Database connection not available"
+UPDATE_FAILED_ERROR = "Update failed"
+NOT_UPDATED_ERROR = "Receipt not found"
+
+# Issue recorded for a valid receipt whose duplicate key was claimed by an earlier one in the run
+DUPLICATE_IN_RUN_ISSUE = "Duplicate of a receipt reconciled earlier in this run"
+
+# reconcile_receipts_async pipeline tuning
+ASYNC_QUEUE_SIZE = 64
+ASYNC_UPDATE_BATCH_SIZE = 100
+ASYNC_UPDATE_FLUSH_SECONDS = 1.0
+
+# Per-receipt messages are DEBUG; running totals are logged at INFO every this many receipts
+PROGRESS_LOG_INTERVAL = 1000
+
 
 class ReceiptReconciler:
     """Orchestrates the receipt reconciliation process."""
@@ -25,16 +100,30 @@ class ReceiptReconciler:
         self.db_connection = db_connection or OracleConnection(connection_name="reconciler")
         self.extractor = ReceiptExtractor(db_connection=self.db_connection)
         self.validator = ReceiptValidator(db_connection=self.db_connection)
+        self._prepare_statements(self.db_connection)
         self._connected = False
     
+    @staticmethod
+    def _prepare_statements(db: OracleConnection) -> None:
+        """Register the status UPDATE statements on a connection."""
+        db.prepare(UPDATE_STATUS_STATEMENT, UPDATE_STATUS_QUERY)
+        db.prepare(RECONCILE_STATEMENT, RECONCILE_QUERY)
+    
     def connect(self) -> bool:
-        """Connect to database."""
+        """Connect to database, or confirm the existing connection is still alive."""
         if not self._connected:
             if self.db_connection.connect():
                 self._connected = True
                 return True
             return False
-        return True
+        # One real check per run; later checks in the run hit the connection's liveness cache
+        return self.db_connection.is_connected() or self._reconnect()
+    
+    def _reconnect(self) -> bool:
+        """Replace a dropped session with a fresh one."""
+        self.db_connection.disconnect()
+        self._connected = self.db_connection.connect()
+        return self._connected
     
     def reconcile_receipts(self, limit: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -47,107 +136,281 @@ class ReceiptReconciler:
             Dictionary with reconciliation results
         """
         if not self.connect():
-            return {
-                "success": False,
-                "error": "Failed to connect to database",
-                "processed": 0,
-                "reconciled": 0,
-                "failed": 0,
-                "needs_review": 0
-            }
-        
-        # Step 1: Extract unreconciled receipts
-        print("\n[Step 1] Extracting unreconciled receipts...")
-        receipts = self.extractor.get_unreconciled_receipts()
-        
-        if not receipts:
-            return {
-                "success": True,
-                "message": "No unreconciled receipts found",
-                "processed": 0,
-                "reconciled": 0,
-                "failed": 0,
-                "needs_review": 0
-            }
+            return self._empty_result(success=False, error="Failed to connect to database")
         
+        # Step 1: Stream unreconciled receipts instead of loading them all up front
+        logger.info("\n[Step 1] Extracting unreconciled receipts...")
+        self.validator.duplicate_index = self.extractor.load_duplicate_index()
+        receipts = self.extractor.iter_unreconciled_receipts()
         if limit:
-            receipts = receipts[:limit]
-        
-        print(f"Found {len(receipts)} receipts to process")
+            receipts = islice(receipts, limit)
         
         # Step 2: Validate each receipt
-        print("\n[Step 2] Validating receipts with AI...")
-        results = {
-            "processed": len(receipts),
+        logger.info("\n[Step 2] Validating receipts with AI...")
+        results = self._new_results()
+        
+        # Receipts to auto-reconcile are written in batches of UPDATE_BATCH_SIZE while
+        # validation continues, each batch on an update worker's own pooled session
+        to_reconcile: List[tuple] = []
+        pending_details: List[Dict[str, Any]] = []
+        submitted: List[tuple] = []
+        
+        with _UpdateWorkers(self) as update_workers:
+            # Loop-invariant lookups bound to locals once, outside the per-receipt loop
+            record_result, submit_updates, batch_size = self._record_result, update_workers.submit, UPDATE_BATCH_SIZE
+            for receipt_data, validation_result in self._validate_concurrently(receipts):
+                record_result(receipt_data, validation_result, results, to_reconcile, pending_details)
+                if len(to_reconcile) >= batch_size:
+                    submitted.append((submit_updates(to_reconcile), pending_details))
+                    to_reconcile, pending_details = [], []
+            if to_reconcile:
+                submitted.append((update_workers.submit(to_reconcile), pending_details))
+            
+            if submitted:
+                logger.info("\n[Step 3] Reconciling %d receipts...", sum(len(details) for _, details in submitted))
+            for future, details in submitted:
+                self._record_updates(future.result(), details, results)
+        
+        if not results["processed"]:
+            return self._empty_result(message="No unreconciled receipts found")
+        
+        self._print_summary(results)
+        results["success"] = True
+        return results
+    
+    async def reconcile_receipts_async(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run the reconciliation flow as an asyncio pipeline.
+        
+        A producer streams receipts from the database in batches, VALIDATION_WORKERS
+        coroutines validate them, and a writer applies status updates every
+        ASYNC_UPDATE_BATCH_SIZE receipts or ASYNC_UPDATE_FLUSH_SECONDS, whichever comes
+        first. Stages are connected by bounded queues, so a slow stage applies backpressure.
+        
+        Args:
+            limit: Optional limit on number of receipts to process
+            
+        Returns:
+            Dictionary with reconciliation results (details in completion order)
+        """
+        if not await asyncio.to_thread(self.connect):
+            return self._empty_result(success=False, error="Failed to connect to database")
+        
+        logger.info("\n[Pipeline] Extracting, validating and reconciling receipts...")
+        self.validator.duplicate_index = await asyncio.to_thread(self.extractor.load_duplicate_index)
+        receipts = self.extractor.iter_unreconciled_receipts()
+        if limit:
+            receipts = islice(receipts, limit)
+        
+        results = self._new_results()
+        to_validate: asyncio.Queue = asyncio.Queue(maxsize=ASYNC_QUEUE_SIZE)
+        validated: asyncio.Queue = asyncio.Queue(maxsize=ASYNC_QUEUE_SIZE)
+        done = object()
+        
+        async def produce() -> None:
+            # The DB cursor is blocking, so each fetch batch is read on a worker thread
+            while batch := await asyncio.to_thread(lambda: list(islice(receipts, ASYNC_UPDATE_BATCH_SIZE))):
+                for receipt_data in batch:
+                    await to_validate.put(receipt_data)
+            for _ in range(VALIDATION_WORKERS):
+                await to_validate.put(done)
+        
+        async def validate() -> None:
+            while (receipt_data := await to_validate.get()) is not done:
+                await validated.put((receipt_data, await self.validator.validate_receipt_async(receipt_data)))
+            await validated.put(done)
+        
+        async def write() -> None:
+            to_reconcile: List[tuple] = []
+            pending_details: List[Dict[str, Any]] = []
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + ASYNC_UPDATE_FLUSH_SECONDS
+            workers_left = VALIDATION_WORKERS
+            while workers_left:
+                try:
+                    item = await asyncio.wait_for(validated.get(), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    item = None
+                if item is done:
+                    workers_left -= 1
+                elif item is not None:
+                    self._record_result(*item, results, to_reconcile, pending_details)
+                if to_reconcile and (len(to_reconcile) >= ASYNC_UPDATE_BATCH_SIZE or loop.time() >= deadline):
+                    await asyncio.to_thread(self._apply_updates, to_reconcile, pending_details, results)
+                    to_reconcile, pending_details = [], []
+                if loop.time() >= deadline:
+                    deadline = loop.time() + ASYNC_UPDATE_FLUSH_SECONDS
+            if to_reconcile:
+                await asyncio.to_thread(self._apply_updates, to_reconcile, pending_details, results)
+        
+        await asyncio.gather(produce(), write(), *(validate() for _ in range(VALIDATION_WORKERS)))
+        
+        if not results["processed"]:
+            return self._empty_result(message="No unreconciled receipts found")
+        
+        self._print_summary(results)
+        results["success"] = True
+        return results
+    
+    @staticmethod
+    def _new_results() -> Dict[str, Any]:
+        """Create the counters a reconciliation run accumulates into."""
+        return {
+            "processed": 0,
             "reconciled": 0,
             "failed": 0,
             "needs_review": 0,
-            "details": []
+            "details": [],
+            "errors": Counter()  # error class -> number of receipts whose update failed with it
+        }
+    
+    @staticmethod
+    def _empty_result(success: bool = True, **extra: Any) -> Dict[str, Any]:
+        """Build the result of a run that processed no receipts."""
+        return {
+            "success": success,
+            **extra,
+            "processed": 0,
+            "reconciled": 0,
+            "failed": 0,
+            "needs_review": 0
         }
+    
+    def _record_result(self, receipt_data: Dict[str, Any], validation_result: Dict[str, Any],
+                       results: Dict[str, Any], to_reconcile: List[tuple],
+                       pending_details: List[Dict[str, Any]]) -> None:
+        """Classify one validated receipt, queueing it for a status update if it qualifies."""
+        processed = results["processed"] = results["processed"] + 1
+        receipt_id = receipt_data.get("ID")
+        receipt_number = receipt_data.get("RECEIPT_NUMBER")
+        # Checked once per receipt so disabled DEBUG messages cost no formatting at all
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("\nProcessed receipt %d: ID=%s, Number=%s", processed, receipt_id, receipt_number)
+        if not processed % PROGRESS_LOG_INTERVAL:
+            logger.info("Progress: %d processed, %d failed, %d need review",
+                        processed, results["failed"], results["needs_review"])
         
-        for i, receipt_data in enumerate(receipts, 1):
-            receipt_id = receipt_data.get("ID")
-            receipt_number = receipt_data.get("RECEIPT_NUMBER")
-            print(f"\nProcessing receipt {i}/{len(receipts)}: ID={receipt_id}, Number={receipt_number}")
-            
-            # Validate receipt
-            validation_result = self.validator.validate_receipt(receipt_data)
-            
-            status = validation_result.get("status")
-            confidence = validation_result.get("confidence", 0)
-            
-            result_detail = {
-                "receipt_id": receipt_id,
-                "receipt_number": receipt_number,
-                "status": status,
-                "confidence": confidence,
-                "reasoning": validation_result.get("reasoning", ""),
-                "issues": validation_result.get("issues", [])
-            }
-            
-            # Step 3: Update status if validated
-            if status == "VALID" and confidence >= MIN_CONFIDENCE_SCORE:
-                if confidence >= AUTO_RECONCILE_THRESHOLD and ENABLE_AUTO_RECONCILE:
-                    if self.update_receipt_status(receipt_id, "R"):
-                        print(f"✓ Auto-reconciled receipt {receipt_id} (confidence: {confidence}%)")
-                        results["reconciled"] += 1
-                        result_detail["action"] = "reconciled"
-                    else:
-                        print(f"✗ Failed to update receipt {receipt_id}")
-                        results["failed"] += 1
-                        result_detail["action"] = "update_failed"
+        status = validation_result.get("status")
+        confidence = validation_result.get("confidence", 0)
+        
+        result_detail = {
+            "receipt_id": receipt_id,
+            "receipt_number": receipt_number,
+            "status": status,
+            "confidence": confidence,
+            "reasoning": validation_result.get("reasoning", ""),
+            "issues": validation_result.get("issues", [])
+        }
+        
+        # Step 3: Queue a status update if validated
+        if status == "VALID" and confidence >= MIN_CONFIDENCE_SCORE:
+            if confidence >= AUTO_RECONCILE_THRESHOLD and ENABLE_AUTO_RECONCILE:
+                # Same-key receipts validated concurrently all passed the duplicate check;
+                # only the first one recorded is reconciled, the rest are duplicates of it
+                if self.validator.claim_reconciled(receipt_data):
+                    to_reconcile.append((RECONCILED_STATUS, receipt_id))
+                    pending_details.append(result_detail)
                 else:
-                    print(f"⚠ Receipt {receipt_id} validated but needs review (confidence: {confidence}%)")
-                    results["needs_review"] += 1
-                    result_detail["action"] = "needs_review"
-            elif status == "INVALID":
-                print(f"✗ Receipt {receipt_id} is invalid")
-                results["failed"] += 1
-                result_detail["action"] = "invalid"
+                    if debug:
+                        logger.debug("✗ Receipt %s duplicates a receipt reconciled in this run", receipt_id)
+                    results["failed"] += 1
+                    result_detail["status"] = "INVALID"
+                    result_detail["issues"] = [*result_detail["issues"], DUPLICATE_IN_RUN_ISSUE]
+                    result_detail["action"] = "invalid"
             else:
-                print(f"⚠ Receipt {receipt_id} needs manual review")
+                if debug:
+                    logger.debug("⚠ Receipt %s validated but needs review (confidence: %s%%)", receipt_id, confidence)
                 results["needs_review"] += 1
                 result_detail["action"] = "needs_review"
-            
-            results["details"].append(result_detail)
-        
-        # Summary
-        print("\n" + "="*60)
-        print("Reconciliation Summary")
-        print("="*60)
-        print(f"Processed: {results['processed']}")
-        print(f"Reconciled: {results['reconciled']}")
-        print(f"Failed: {results['failed']}")
-        print(f"Needs Review: {results['needs_review']}")
-        print("="*60)
+        elif status == "INVALID":
+            if debug:
+                logger.debug("✗ Receipt %s is invalid", receipt_id)
+            results["failed"] += 1
+            result_detail["action"] = "invalid"
+        else:
+            if debug:
+                logger.debug("⚠ Receipt %s needs manual review", receipt_id)
+            results["needs_review"] += 1
+            result_detail["action"] = "needs_review"
         
-        results["success"] = True
-        return results
+        results["details"].append(result_detail)
+    
+    def _apply_updates(self, to_reconcile: List[tuple], pending_details: List[Dict[str, Any]],
+                       results: Dict[str, Any]) -> None:
+        """Write queued status updates and record which receipts were reconciled."""
+        self._record_updates(self.update_receipt_statuses(to_reconcile), pending_details, results)
+    
+    @classmethod
+    def _record_updates(cls, failed_rows: Dict[int, str], pending_details: List[Dict[str, Any]],
+                        results: Dict[str, Any]) -> None:
+        """Record the outcome of a batch of status updates against its result details."""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for row, result_detail in enumerate(pending_details):
+            receipt_id = result_detail["receipt_id"]
+            error = failed_rows.get(row)
+            if error is not None:
+                if debug:
+                    logger.debug("✗ Failed to update receipt %s: %s", receipt_id, error)
+                results["failed"] += 1
+                results["errors"][cls._error_class(error)] += 1
+                result_detail["action"] = "update_failed"
+                result_detail["error"] = error
+            else:
+                if debug:
+                    logger.debug("✓ Auto-reconciled receipt %s (confidence: %s%%)", receipt_id, result_detail["confidence"])
+                results["reconciled"] += 1
+                result_detail["action"] = "reconciled"
+    
+    @staticmethod
+    def _print_summary(results: Dict[str, Any]) -> None:
+        """Log the run summary."""
+        rule = "=" * 60
+        logger.info("\n%s\nReconciliation Summary\n%s\nProcessed: %d\nReconciled: %d\nFailed: %d\nNeeds Review: %d\n%s",
+                    rule, rule, results["processed"], results["reconciled"], results["failed"],
+                    results["needs_review"], rule)
+        if results.get("errors"):
+            # Failed updates are reported once per error class rather than once per receipt
+            logger.warning("Update errors: %s", ", ".join(f"{error_class} x{count}" for error_class, count in results["errors"].most_common()))
+    
+    @staticmethod
+    def _error_class(error: str) -> str:
+        """Reduce an error message to its class, e.g. 'ORA-00001' for an Oracle error."""
+        return error.split(":", 1)[0].strip() or error
+    
+    def _validate_concurrently(self, receipts: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Validate receipts on a thread pool so their AI/DB round-trips overlap.
+        
+        At most 2 * VALIDATION_WORKERS receipts are in flight, so a streamed extract is
+        never fully materialized. Results are yielded in input order.
+        
+        Args:
+            receipts: Iterable of receipt dictionaries
+            
+        Yields:
+            (receipt_data, validation_result) tuples
+        """
+        with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as executor:
+            in_flight = deque()
+            submit, validate = executor.submit, self.validator.validate_receipt
+            push, pop, max_in_flight = in_flight.append, in_flight.popleft, 2 * VALIDATION_WORKERS
+            for receipt_data in receipts:
+                push((receipt_data, submit(validate, receipt_data)))
+                if len(in_flight) >= max_in_flight:
+                    receipt_data, future = pop()
+                    yield receipt_data, future.result()
+            while in_flight:
+                receipt_data, future = in_flight.popleft()
+                yield receipt_data, future.result()
     
     def update_receipt_status(self, receipt_id: Any, new_status: str) -> bool:
         """
         Update receipt status in database.
         
+        Failures are not logged per receipt; the driver error of a failed update is
+        available from db_connection.last_error() so callers can aggregate them.
+        
         Args:
             receipt_id: Receipt ID to update
             new_status: New status ('R' for reconciled)
@@ -155,27 +418,96 @@ class ReceiptReconciler:
         Returns:
             True if update successful, False otherwise
         """
-        if not self.db_connection or not self.db_connection.is_connected():
-            print("✗ Database connection not available")
+        # execute_update checks the connection itself; checking here as well doubled the probes per row
+        if not self.db_connection:
+            return False
+        
+        try:
+            if new_status == RECONCILED_STATUS:
+                return self.db_connection.execute_prepared(RECONCILE_STATEMENT, (receipt_id,))
+            return self.db_connection.execute_prepared(UPDATE_STATUS_STATEMENT, (new_status, receipt_id))
+        except Exception as e:
+            logger.debug("✗ Error updating receipt %s: %s", receipt_id, e)
             return False
+    
+    def update_receipt_statuses(self, updates: List[tuple]) -> Dict[int, str]:
+        """
+        Update many receipt statuses in as few round-trips as possible, with a single commit.
         
-        query = """
-            UPDATE CFMSPRO.RECEIPT_DETAILS
-            SET STATUS = :new_status,
-                UPDATED_AT = SYSTIMESTAMP,
-                RECONCILED_AT = SYSTIMESTAMP,
-                RECONCILED_BY = 'SYSTEM'
-            WHERE ID = :receipt_id
+        Numeric IDs are updated with one fused UPDATE ... WHERE ID IN (...) per status;
+        otherwise (or if the collection type is unavailable) the updates go through array DML.
+        
+        Args:
+            updates: List of (new_status, receipt_id) tuples
+            
+        Returns:
+            Error message for each position in updates whose row was not updated
+            (every position on error)
         """
+        return self._update_statuses(updates, self.db_connection)
+    
+    def _update_statuses(self, updates: List[tuple], db: Optional[OracleConnection]) -> Dict[int, str]:
+        """update_receipt_statuses against a given connection (None if it could not connect)."""
+        if not db:
+            return dict.fromkeys(range(len(updates)), NO_CONNECTION_ERROR)
+        
+        failed = self._fused_update_statuses(updates, db)
+        if failed is not None:
+            return failed
+        
+        self._prepare_statements(db)
+        failed_rows: Dict[int, str] = {}
+        if all(new_status == RECONCILED_STATUS for new_status, _ in updates):
+            executed = db.prepare_many(RECONCILE_STATEMENT, [(receipt_id,) for _, receipt_id in updates], failed_rows=failed_rows)
+        else:
+            executed = db.prepare_many(UPDATE_STATUS_STATEMENT, updates, failed_rows=failed_rows)
+        if executed < 0:
+            return dict.fromkeys(range(len(updates)), db.last_error() or UPDATE_FAILED_ERROR)
+        return failed_rows
+    
+    @staticmethod
+    def _fused_update_statuses(updates: List[tuple], db: OracleConnection) -> Optional[Dict[int, str]]:
+        """Run the fused status UPDATE; returns None when it cannot be used for these updates."""
+        if not all(type(receipt_id) is int for _, receipt_id in updates):
+            return None
+        conn = db.get_connection()
+        if conn is None:
+            return None
+        try:
+            id_list_type = conn.gettype(ID_LIST_TYPE)
+        except Exception:
+            return None
         
+        ids_by_status: Dict[str, List[int]] = {}
+        for new_status, receipt_id in updates:
+            ids_by_status.setdefault(new_status, []).append(receipt_id)
+        
+        updated = set()
         try:
-            return self.db_connection.execute_update(
-                query,
-                params=(new_status, receipt_id)
-            )
+            with db.transaction():
+                cursor = conn.cursor()
+                try:
+                    for new_status, ids in ids_by_status.items():
+                        for start in range(0, len(ids), FUSED_UPDATE_CHUNK_SIZE):
+                            chunk = ids[start:start + FUSED_UPDATE_CHUNK_SIZE]
+                            updated_ids = cursor.var(int, arraysize=len(chunk))
+                            if new_status == RECONCILED_STATUS:
+                                cursor.execute(FUSED_RECONCILE_QUERY, receipt_ids=id_list_type.newobject(chunk),
+                                               updated_ids=updated_ids)
+                            else:
+                                cursor.execute(FUSED_UPDATE_STATUS_QUERY, new_status=new_status,
+                                               receipt_ids=id_list_type.newobject(chunk), updated_ids=updated_ids)
+                            updated.update(updated_ids.getvalue())
+                finally:
+                    cursor.close()
         except Exception as e:
-            print(f"✗ Error updating receipt {receipt_id}: {str(e)}")
-            return False
+            return dict.fromkeys(range(len(updates)), str(e))
+        return {row: NOT_UPDATED_ERROR for row, (_, receipt_id) in enumerate(updates) if receipt_id not in updated}
+    
+    def _worker_connection(self, index: int) -> Optional[OracleConnection]:
+        """Open an update worker's own connection, drawing a session from the shared pool."""
+        db = self.db_connection.clone(f"{self.db_connection.connection_name}_update_{index}")
+        return db if db.connect() else None
     
     def disconnect(self) -> None:
         """Disconnect from database."""
@@ -192,3 +524,40 @@ class ReceiptReconciler:
         """Context manager exit."""
         self.disconnect()
 
+
+class _UpdateWorkers:
+    """
+    Thread pool applying status-update batches for ReceiptReconciler.reconcile_receipts.
+    
+    Each of the UPDATE_WORKERS threads opens its own connection on first use, so batches
+    are written and committed in parallel on separate pooled sessions. The connections are
+    released back to the pool when the with-block exits.
+    """
+    
+    __slots__ = ("reconciler", "executor", "local", "connections", "worker_ids")
+    
+    def __init__(self, reconciler: ReceiptReconciler):
+        self.reconciler = reconciler
+        self.executor = ThreadPoolExecutor(max_workers=UPDATE_WORKERS, thread_name_prefix="receipt-update")
+        self.local = threading.local()
+        self.connections: List[OracleConnection] = []
+        self.worker_ids = count()
+    
+    def submit(self, updates: List[tuple]) -> "Future[Dict[int, str]]":
+        """Queue a batch of (new_status, receipt_id) updates; the future holds its failed rows."""
+        return self.executor.submit(self._run, updates)
+    
+    def _run(self, updates: List[tuple]) -> Dict[int, str]:
+        if not hasattr(self.local, "db"):
+            self.local.db = self.reconciler._worker_connection(next(self.worker_ids))
+            if self.local.db is not None:
+                self.connections.append(self.local.db)
+        return self.reconciler._update_statuses(updates, self.local.db)
+    
+    def __enter__(self) -> "_UpdateWorkers":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.executor.shutdown(wait=True)
+        for db in self.connections:
+            db.disconnect()
@@ -1,67 +1,262 @@
 """Extract receipt data from Oracle database."""
 
-from typing import List, Optional, Dict, Any
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
 from src.database import OracleConnection
+from src.features.reconciliation.receipts.tools import DUPLICATE_KEY_FIELDS
+from src.utils.db_helpers import AdaptiveBatchSize
+from src.utils.log_helpers import get_logger
+from config.reconciliation_config import RECEIPT_FETCH_ARRAYSIZE
+
+logger = get_logger("lxdb.reconciliation")
+
+
+UNRECONCILED_RECEIPTS_QUERY = """
+    SELECT *
+    FROM CFMSPRO.RECEIPT_DETAILS
+    WHERE STATUS = 'U'
+    ORDER BY ID
+"""
+
+# Reconciled-receipt counts per duplicate key, limited to the (MONTH, YEAR, EMPLOYER_ID)
+# groups of the candidates: every unreconciled receipt, or explicit bound groups
+_DUPLICATE_COLUMNS = ", ".join(DUPLICATE_KEY_FIELDS)
+DUPLICATE_INDEX_QUERY = f"""
+    SELECT {_DUPLICATE_COLUMNS}, COUNT(*)
+    FROM CFMSPRO.RECEIPT_DETAILS
+    WHERE STATUS = 'R'
+    AND (MONTH, YEAR, EMPLOYER_ID) IN ({{candidates}})
+    GROUP BY {_DUPLICATE_COLUMNS}
+"""
+UNRECONCILED_GROUPS_QUERY = "SELECT MONTH, YEAR, EMPLOYER_ID FROM CFMSPRO.RECEIPT_DETAILS WHERE STATUS = 'U'"
+DUPLICATE_INDEX_CHUNK_SIZE = 500
+# Bounds for the adaptive candidate chunk (3 binds per group, under Oracle's 65535 bind limit)
+DUPLICATE_INDEX_CHUNK_MIN = 100
+DUPLICATE_INDEX_CHUNK_MAX = 5000
+
+# Bounds for the adaptive fetch size of the unreconciled-receipts stream
+FETCH_BATCH_MIN = 256
+FETCH_BATCH_MAX = 10000
+
+RECEIPT_BY_ID_QUERY = """
+    SELECT *
+    FROM CFMSPRO.RECEIPT_DETAILS
+    WHERE ID = :receipt_id
+"""
 
 
 class ReceiptExtractor:
     """Extracts unreconciled receipts from CFMSPRO.RECEIPT_DETAILS."""
     
-    def __init__(self, db_connection: Optional[OracleConnection] = None):
+    def __init__(self, db_connection: Optional[OracleConnection] = None, arraysize: Optional[int] = None):
         """
         Initialize receipt extractor.
         
         Args:
-            db_connection: Oracle database connection. If None, creates a new one.
+            db_connection: Oracle database connection. If None, each operation borrows a
+                session from the shared Oracle pool.
+            arraysize: Rows fetched per round-trip when extracting (default RECEIPT_FETCH_ARRAYSIZE)
         """
         self.db_connection = db_connection
         self._own_connection = db_connection is None
+        self.arraysize = arraysize or RECEIPT_FETCH_ARRAYSIZE
+        # Query text -> column names; the RECEIPT_DETAILS schema does not change within a process
+        self._column_cache: Dict[str, Tuple[str, ...]] = {}
+    
+    @contextmanager
+    def _session(self) -> Iterator[Any]:
+        """
+        Get a database session for one operation.
+        
+        A connection passed in by the caller is used as-is. Otherwise a session is checked
+        out of the shared Oracle pool and returned when the operation ends, so an idle
+        extractor holds no session and concurrent users reuse warm ones.
+        
+        Yields:
+            Raw Oracle connection
+        """
+        if not self._own_connection:
+            yield self.db_connection.get_connection()
+            return
+        if self.db_connection is None:
+            self.db_connection = OracleConnection(connection_name="receipt_extractor")
+        with self.db_connection.checkout() as connection:
+            yield connection
+    
+    def _columns(self, query: str, cursor: Any) -> Tuple[str, ...]:
+        """Get the column names of an executed query, reading cursor.description only once per query."""
+        columns = self._column_cache.get(query)
+        if columns is None:
+            columns = self._column_cache[query] = tuple(desc[0] for desc in cursor.description)
+        return columns
+    
+    def _fetch_dicts(self, query: str, cursor: Any) -> None:
+        """Have an executed cursor return rows as column-name dictionaries, built by the driver as it fetches."""
+        columns = self._columns(query, cursor)
+        cursor.rowfactory = lambda *row: dict(zip(columns, row))
     
     def get_unreconciled_receipts(self) -> List[Dict[str, Any]]:
         """
         Extract all unreconciled receipts (STATUS='U') from CFMSPRO.RECEIPT_DETAILS.
         
+        Loads every receipt into memory; prefer iter_unreconciled_receipts() for large extracts.
+        
         Returns:
             List of receipt records as dictionaries
         """
-        if not self.db_connection:
-            self.db_connection = OracleConnection(connection_name="receipt_extractor")
-            if not self.db_connection.connect():
-                print("✗ Failed to connect to database for receipt extraction")
-                return []
-        
-        query = """
-            SELECT *
-            FROM CFMSPRO.RECEIPT_DETAILS
-            WHERE STATUS = 'U'
-            ORDER BY ID
+        receipts = list(self.iter_unreconciled_receipts())
+        if receipts:
+            logger.info("✓ Extracted %d unreconciled receipts", len(receipts))
+        else:
+            logger.info("ℹ No unreconciled receipts found")
+        return receipts
+    
+    def get_unreconciled_columns(self) -> Dict[str, List[Any]]:
         """
+        Extract all unreconciled receipts (STATUS='U') column-wise.
+        
+        Each column name maps to one list holding that column's value for every receipt,
+        in ID order, so rows share their keys instead of carrying one dict each. Batch
+        checks can then work on whole columns (see tools.check_numeric_columns).
         
+        Returns:
+            Dictionary of column name to list of values (empty if there are no receipts)
+        """
         try:
-            results = self.db_connection.execute_query(query)
-            
-            if not results:
-                print("ℹ No unreconciled receipts found")
-                return []
-            
-            # Get column names from cursor description
-            cursor = self.db_connection.get_connection().cursor()
-            cursor.execute(query)
-            columns = [desc[0] for desc in cursor.description]
-            cursor.close()
-            
-            # Convert tuples to dictionaries
-            receipts = []
-            for row in results:
-                receipt_dict = dict(zip(columns, row))
-                receipts.append(receipt_dict)
+            with self._session() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.arraysize = self.arraysize
+                    cursor.prefetchrows = self.arraysize + 1
+                    cursor.execute(UNRECONCILED_RECEIPTS_QUERY)
+                    columns = self._columns(UNRECONCILED_RECEIPTS_QUERY, cursor)
+                    data = tuple([] for _ in columns)
+                    # Transpose each fetched batch onto the column lists
+                    while rows := cursor.fetchmany(self.arraysize):
+                        for values, batch_values in zip(data, zip(*rows)):
+                            values.extend(batch_values)
+                finally:
+                    cursor.close()
+        except Exception as e:
+            logger.error("✗ Error extracting receipts: %s", e)
+            return {}
+        
+        if not data[0]:
+            logger.info("ℹ No unreconciled receipts found")
+            return {}
+        
+        logger.info("✓ Extracted %d unreconciled receipts", len(data[0]))
+        return dict(zip(columns, data))
+    
+    def iter_unreconciled_receipts(self, arraysize: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream unreconciled receipts (STATUS='U') one at a time.
+        
+        Rows are fetched in batches, so memory use stays bounded by one batch no matter
+        how many receipts are waiting. The batch starts at arraysize and is resized after
+        each round-trip to keep it near the target latency (see AdaptiveBatchSize).
+        
+        Args:
+            arraysize: Initial number of rows fetched per round-trip (default: the extractor's arraysize)
             
-            print(f"✓ Extracted {len(receipts)} unreconciled receipts")
-            return receipts
+        Yields:
+            Receipt records as dictionaries
+        """
+        arraysize = arraysize or self.arraysize
+        try:
+            with self._session() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.arraysize = arraysize
+                    cursor.prefetchrows = arraysize + 1
+                    cursor.execute(UNRECONCILED_RECEIPTS_QUERY)
+                    self._fetch_dicts(UNRECONCILED_RECEIPTS_QUERY, cursor)
+                    batch = AdaptiveBatchSize(arraysize, FETCH_BATCH_MIN, FETCH_BATCH_MAX)
+                    while True:
+                        cursor.arraysize = batch.size
+                        started = time.perf_counter()
+                        rows = cursor.fetchmany(batch.size)
+                        if not rows:
+                            break
+                        batch.record(time.perf_counter() - started)
+                        yield from rows
+                finally:
+                    cursor.close()
+        except Exception as e:
+            logger.error("✗ Error extracting receipts: %s", e)
+    
+    def load_duplicate_index(self, candidate_receipts: Optional[Iterable[Dict[str, Any]]] = None) -> Optional[Dict[Tuple[Any, ...], int]]:
+        """
+        Count reconciled receipts per duplicate key in one grouped query.
+        
+        The result lets check_duplicate answer from memory instead of running a
+        COUNT(*) per receipt.
+        
+        Args:
+            candidate_receipts: Receipts that will be checked; if None, every unreconciled
+                receipt (resolved in the same query, without binding any values)
             
+        Returns:
+            Dictionary of duplicate_key() to number of reconciled receipts, or None on error
+        """
+        batch = AdaptiveBatchSize(DUPLICATE_INDEX_CHUNK_SIZE, DUPLICATE_INDEX_CHUNK_MIN, DUPLICATE_INDEX_CHUNK_MAX)
+        if candidate_receipts is None:
+            statements = iter([(DUPLICATE_INDEX_QUERY.format(candidates=UNRECONCILED_GROUPS_QUERY), {})])
+        else:
+            groups = list(dict.fromkeys((receipt.get('MONTH'), receipt.get('YEAR'), receipt.get('EMPLOYER_ID'))
+                                        for receipt in candidate_receipts))
+            statements = self._duplicate_index_statements(groups, batch)
+        
+        duplicate_index: Dict[Tuple[Any, ...], int] = {}
+        try:
+            with self._session() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.arraysize = self.arraysize
+                    for query, binds in statements:
+                        started = time.perf_counter()
+                        cursor.execute(query, binds)
+                        while rows := cursor.fetchmany(self.arraysize):
+                            for row in rows:
+                                duplicate_index[row[:-1]] = row[-1]
+                        batch.record(time.perf_counter() - started)
+                finally:
+                    cursor.close()
         except Exception as e:
-            print(f"✗ Error extracting receipts: {str(e)}")
-            return []
+            logger.error("✗ Error loading duplicate index: %s", e)
+            return None
+        return duplicate_index
+    
+    @staticmethod
+    def _duplicate_index_statements(groups: List[Tuple[Any, ...]],
+                                    batch: AdaptiveBatchSize) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Build the duplicate-index query for successive chunks of candidate groups.
+        
+        Each chunk is batch.size groups long, read when the chunk is built, so the
+        caller's batch.record() calls resize the chunks that follow. A short last chunk is
+        padded by repeating its final group, so it reuses the SQL text (and parsed
+        statement) of a full chunk rather than adding one of its own.
+        
+        Args:
+            groups: Distinct (MONTH, YEAR, EMPLOYER_ID) tuples to look up
+            batch: Chunk size controller
+            
+        Yields:
+            (query, binds) for each chunk
+        """
+        start = 0
+        while start < len(groups):
+            size = batch.size
+            chunk = groups[start:start + size]
+            start += len(chunk)
+            chunk += [chunk[-1]] * (size - len(chunk))
+            candidates = ", ".join(f"(:m{i}, :y{i}, :e{i})" for i in range(len(chunk)))
+            binds = {}
+            for i, (month, year, employer_id) in enumerate(chunk):
+                binds[f"m{i}"], binds[f"y{i}"], binds[f"e{i}"] = month, year, employer_id
+            yield DUPLICATE_INDEX_QUERY.format(candidates=candidates), binds
     
     def get_receipt_by_id(self, receipt_id: Any) -> Optional[Dict[str, Any]]:
         """
@@ -73,40 +268,25 @@ class ReceiptExtractor:
         Returns:
             Receipt record as dictionary or None if not found
         """
-        if not self.db_connection:
-            self.db_connection = OracleConnection(connection_name="receipt_extractor")
-            if not self.db_connection.connect():
-                return None
-        
-        query = """
-            SELECT *
-            FROM CFMSPRO.RECEIPT_DETAILS
-            WHERE ID = :receipt_id
-        """
-        
         try:
-            cursor = self.db_connection.get_connection().cursor()
-            cursor.execute(query, {"receipt_id": receipt_id})
-            row = cursor.fetchone()
-            columns = [desc[0] for desc in cursor.description]
-            cursor.close()
-            
-            if row:
-                return dict(zip(columns, row))
-            return None
-            
+            with self._session() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(RECEIPT_BY_ID_QUERY, {"receipt_id": receipt_id})
+                    self._fetch_dicts(RECEIPT_BY_ID_QUERY, cursor)
+                    return cursor.fetchone()
+                finally:
+                    cursor.close()
         except Exception as e:
-            print(f"✗ Error retrieving receipt {receipt_id}: {str(e)}")
+            logger.error("✗ Error retrieving receipt %s: %s", receipt_id, e)
             return None
     
     def __enter__(self):
         """Context manager entry."""
-        if not self.db_connection:
-            self.db_connection = OracleConnection(connection_name="receipt_extractor")
-            self.db_connection.connect()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
+        # Sessions are checked out per operation and already back in the pool
         if self._own_connection and self.db_connection:
             self.db_connection.disconnect()
@@ -6,7 +6,10 @@ from .validation_tools import (
     check_logical_consistency,
     check_duplicate,
     check_business_rules,
+    DUPLICATE_KEY_FIELDS,
+    duplicate_key,
 )
+from .batch_checks import NUMERIC_RULES, check_numeric_columns, failing_rows
 
 __all__ = [
     "check_receipt_validity",
@@ -14,4 +17,9 @@ __all__ = [
     "check_logical_consistency",
     "check_duplicate",
     "check_business_rules",
+    "DUPLICATE_KEY_FIELDS",
+    "duplicate_key",
+    "NUMERIC_RULES",
+    "check_numeric_columns",
+    "failing_rows",
 ]
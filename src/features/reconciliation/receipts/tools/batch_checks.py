@@ -0,0 +1,74 @@
+"""Column-wise numeric checks over many receipts at once."""
+
+from typing import Any, Dict, List, Optional, Sequence
+from config.reconciliation_config import MAX_RECEIPT_AMOUNT, VALID_MONTHS, MIN_YEAR, MAX_YEAR
+
+# Rule names, in the order they appear in check_numeric_columns() results
+NUMERIC_RULES = (
+    "invalid_amount",
+    "non_positive_amount",
+    "amount_over_maximum",
+    "invalid_month",
+    "year_out_of_range",
+)
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def check_numeric_columns(columns: Dict[str, Sequence[Any]]) -> Dict[str, List[bool]]:
+    """
+    Run the amount, month and year range checks over whole columns.
+    
+    Applies the same bounds as check_business_rules and check_logical_consistency,
+    but parses each column once and evaluates every rule as one pass over it instead
+    of a tool call per receipt. Missing (None) values are not flagged, as in the tools.
+    
+    Args:
+        columns: Column name to values, as returned by
+            ReceiptExtractor.get_unreconciled_columns()
+    
+    Returns:
+        Rule name (see NUMERIC_RULES) to one flag per receipt, True where the rule is violated
+    """
+    missing = [None] * len(next(iter(columns.values()), ()))
+    amount_values = columns.get("AMOUNT", missing)
+    month_values = columns.get("MONTH", missing)
+    year_values = columns.get("YEAR", missing)
+    
+    amounts = list(map(_as_float, amount_values))
+    months = list(map(_as_int, month_values))
+    years = list(map(_as_int, year_values))
+    
+    return {
+        "invalid_amount": [value is not None and amount is None for value, amount in zip(amount_values, amounts)],
+        "non_positive_amount": [amount is not None and amount <= 0 for amount in amounts],
+        "amount_over_maximum": [amount is not None and amount > MAX_RECEIPT_AMOUNT for amount in amounts],
+        "invalid_month": [value is not None and month not in VALID_MONTHS for value, month in zip(month_values, months)],
+        "year_out_of_range": [value is not None and (year is None or not MIN_YEAR <= year <= MAX_YEAR)
+                              for value, year in zip(year_values, years)],
+    }
+
+
+def failing_rows(flags: Dict[str, List[bool]]) -> List[int]:
+    """
+    Get the receipts that violate at least one rule.
+    
+    Args:
+        flags: Result of check_numeric_columns()
+    
+    Returns:
+        Row positions (into the extracted columns) with any flag set
+    """
+    return [row for row, row_flags in enumerate(zip(*flags.values())) if any(row_flags)]
@@ -1,8 +1,66 @@
 """Validation tools for receipt reconciliation."""
 
-from typing import Dict, Any, Optional
+from datetime import date, datetime
+from typing import Dict, Any, Optional, Tuple
 from langchain.tools import tool
 from src.database import OracleConnection
+from config.reconciliation_config import VALID_MONTHS, MIN_YEAR, MAX_YEAR
+
+# Allowed values, as lists for messages and frozensets for per-receipt membership tests
+_REQUIRED_FIELDS = ('ID', 'RECEIPT_NUMBER', 'AMOUNT', 'STATUS', 'EMPLOYER_ID', 'OFFICE_ID', 'MONTH', 'YEAR', 'SCHEME_ID', 'RECEIPT_TYPE', 'APPORTION_TYPE')
+_STATUS_CHOICES = ['U', 'R', 'REV', 'I']
+_TYPE_CHOICES = ['1', '2', '3', '4', '5']
+_APPORTION_CHOICES = ['Auto', 'Normal']
+_VALID_STATUSES = frozenset(_STATUS_CHOICES)
+_VALID_TYPES = frozenset(_TYPE_CHOICES)
+_VALID_APPORTIONS = frozenset(_APPORTION_CHOICES)
+
+# Format of RECEIPT_DATE when it arrives as text (a time part, if any, is ignored)
+_DATE_FMT = '%Y-%m-%d'
+
+# Fields of the unique constraint two receipts must share to be duplicates
+DUPLICATE_KEY_FIELDS = ('MONTH', 'YEAR', 'RECEIPT_NUMBER', 'EMPLOYER_ID', 'RECEIPT_TYPE', 'PENALTY_ID', 'ADJUSTMENT_ID')
+
+# Reconciled receipts sharing the unique constraint fields. The nullable ids are compared
+# through NVL (-1 is never a real id) rather than "= :x OR (x IS NULL AND :x IS NULL)", so
+# the whole predicate can be answered from one function-based index:
+#   CREATE INDEX IX_RD_DUPKEY ON CFMSPRO.RECEIPT_DETAILS
+#       (MONTH, YEAR, RECEIPT_NUMBER, EMPLOYER_ID, RECEIPT_TYPE, NVL(PENALTY_ID, -1), NVL(ADJUSTMENT_ID, -1)) ONLINE;
+DUPLICATE_CHECK_QUERY = """
+    SELECT COUNT(*) as duplicate_count
+    FROM CFMSPRO.RECEIPT_DETAILS
+    WHERE STATUS = 'R'
+    AND ID != :receipt_id
+    AND MONTH = :month
+    AND RECEIPT_NUMBER = :receipt_number
+    AND YEAR = :year
+    AND EMPLOYER_ID = :employer_id
+    AND RECEIPT_TYPE = :receipt_type
+    AND NVL(PENALTY_ID, -1) = NVL(:penalty_id, -1)
+    AND NVL(ADJUSTMENT_ID, -1) = NVL(:adjustment_id, -1)
+"""
+
+
+def duplicate_key(receipt_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Build the duplicate-index key of a receipt.
+    
+    Args:
+        receipt_data: Dictionary containing receipt information
+        
+    Returns:
+        Tuple of the receipt's DUPLICATE_KEY_FIELDS values
+    """
+    return tuple(receipt_data.get(field) for field in DUPLICATE_KEY_FIELDS)
+
+
+def _as_date(value: Any) -> Optional[date]:
+    """Get a RECEIPT_DATE value as a date; driver datetimes pass through, text is parsed (ValueError if malformed)."""
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return datetime.strptime(value.split()[0], _DATE_FMT)
+    return None
 
 
 @tool
@@ -16,8 +74,7 @@ def check_receipt_validity(receipt_data: Dict[str, Any]) -> str:
     Returns:
         Validation result as string
     """
-    required_fields = ['ID', 'RECEIPT_NUMBER', 'AMOUNT', 'STATUS', 'EMPLOYER_ID', 'OFFICE_ID', 'MONTH', 'YEAR', 'SCHEME_ID', 'RECEIPT_TYPE', 'APPORTION_TYPE']
-    missing_fields = [field for field in required_fields if receipt_data.get(field) is None]
+    missing_fields = [field for field in _REQUIRED_FIELDS if receipt_data.get(field) is None]
     
     if missing_fields:
         return f"INVALID: Missing required fields: {', '.join(missing_fields)}"
@@ -32,21 +89,18 @@ def check_receipt_validity(receipt_data: Dict[str, Any]) -> str:
     
     # Check status is valid
     status = str(receipt_data.get('STATUS', '')).upper()
-    valid_statuses = ['U', 'R', 'REV', 'I']
-    if status not in valid_statuses:
-        return f"INVALID: Status must be one of {valid_statuses}, got '{status}'"
+    if status not in _VALID_STATUSES:
+        return f"INVALID: Status must be one of {_STATUS_CHOICES}, got '{status}'"
     
     # Check receipt type is valid
     receipt_type = str(receipt_data.get('RECEIPT_TYPE', ''))
-    valid_types = ['1', '2', '3', '4', '5']
-    if receipt_type not in valid_types:
-        return f"INVALID: Receipt type must be one of {valid_types}, got '{receipt_type}'"
+    if receipt_type not in _VALID_TYPES:
+        return f"INVALID: Receipt type must be one of {_TYPE_CHOICES}, got '{receipt_type}'"
     
     # Check apportion type is valid
     apportion_type = str(receipt_data.get('APPORTION_TYPE', ''))
-    valid_apportions = ['Auto', 'Normal']
-    if apportion_type not in valid_apportions:
-        return f"INVALID: Apportion type must be one of {valid_apportions}, got '{apportion_type}'"
+    if apportion_type not in _VALID_APPORTIONS:
+        return f"INVALID: Apportion type must be one of {_APPORTION_CHOICES}, got '{apportion_type}'"
     
     return "VALID: Receipt has all required fields and valid format"
 
@@ -102,7 +156,7 @@ def check_logical_consistency(receipt_data: Dict[str, Any]) -> str:
     if month is not None:
         try:
             month_int = int(month)
-            if month_int < 1 or month_int > 12:
+            if month_int not in VALID_MONTHS:
                 issues.append(f"Invalid month: {month_int}")
         except (ValueError, TypeError):
             issues.append(f"Invalid month format: {month}")
@@ -112,7 +166,7 @@ def check_logical_consistency(receipt_data: Dict[str, Any]) -> str:
     if year is not None:
         try:
             year_int = int(year)
-            if year_int < 2000 or year_int > 2100:
+            if not MIN_YEAR <= year_int <= MAX_YEAR:
                 issues.append(f"Suspicious year: {year_int}")
         except (ValueError, TypeError):
             issues.append(f"Invalid year format: {year}")
@@ -133,11 +187,9 @@ def check_logical_consistency(receipt_data: Dict[str, Any]) -> str:
     receipt_date = receipt_data.get('RECEIPT_DATE')
     if receipt_date and month and year:
         try:
-            from datetime import datetime
-            if isinstance(receipt_date, str):
-                date_obj = datetime.strptime(receipt_date.split()[0], '%Y-%m-%d')
-                if date_obj.month != int(month) or date_obj.year != int(year):
-                    issues.append(f"Receipt date inconsistent with month/year: date={receipt_date}, month={month}, year={year}")
+            date_obj = _as_date(receipt_date)
+            if date_obj and (date_obj.month != int(month) or date_obj.year != int(year)):
+                issues.append(f"Receipt date inconsistent with month/year: date={receipt_date}, month={month}, year={year}")
         except Exception:
             pass  # Skip date validation if parsing fails
     
@@ -148,18 +200,21 @@ def check_logical_consistency(receipt_data: Dict[str, Any]) -> str:
 
 
 @tool
-def check_duplicate(receipt_data: Dict[str, Any], db_connection: Optional[OracleConnection] = None) -> str:
+def check_duplicate(receipt_data: Dict[str, Any], db_connection: Optional[OracleConnection] = None,
+                    duplicate_index: Optional[Dict[Tuple[Any, ...], int]] = None) -> str:
     """
     Check if receipt is a duplicate of an existing reconciled receipt.
     
     Args:
         receipt_data: Dictionary containing receipt information
         db_connection: Optional database connection for duplicate checking
+        duplicate_index: Optional reconciled-receipt counts by duplicate_key(), e.g. from
+            ReceiptExtractor.load_duplicate_index(); looked up instead of querying the database
         
     Returns:
         Validation result as string
     """
-    if not db_connection:
+    if duplicate_index is None and not db_connection:
         return "WARNING: Cannot check duplicates without database connection"
     
     receipt_id = receipt_data.get('ID')
@@ -175,24 +230,16 @@ def check_duplicate(receipt_data: Dict[str, Any], db_connection: Optional[Oracle
     if not all([receipt_id, receipt_number, amount, employer_id, month, year, receipt_type]):
         return "WARNING: Insufficient data to check duplicates"
     
+    if duplicate_index is not None:
+        duplicate_count = duplicate_index.get(duplicate_key(receipt_data), 0)
+        if duplicate_count > 0:
+            return f"DUPLICATE: Found {duplicate_count} similar reconciled receipt(s)"
+        return "UNIQUE: No duplicates found"
+    
     try:
         # Check for similar receipts with status 'R' (reconciled) using the unique constraint fields
-        query = """
-            SELECT COUNT(*) as duplicate_count
-            FROM CFMSPRO.RECEIPT_DETAILS
-            WHERE STATUS = 'R'
-            AND ID != :receipt_id
-            AND MONTH = :month
-            AND RECEIPT_NUMBER = :receipt_number
-            AND YEAR = :year
-            AND EMPLOYER_ID = :employer_id
-            AND RECEIPT_TYPE = :receipt_type
-            AND (PENALTY_ID = :penalty_id OR (PENALTY_ID IS NULL AND :penalty_id IS NULL))
-            AND (ADJUSTMENT_ID = :adjustment_id OR (ADJUSTMENT_ID IS NULL AND :adjustment_id IS NULL))
-        """
-        
         cursor = db_connection.get_connection().cursor()
-        cursor.execute(query, {
+        cursor.execute(DUPLICATE_CHECK_QUERY, {
             'receipt_id': receipt_id,
             'receipt_number': receipt_number,
             'month': month,
@@ -243,11 +290,9 @@ def check_business_rules(receipt_data: Dict[str, Any]) -> str:
     receipt_date = receipt_data.get('RECEIPT_DATE')
     if receipt_date and month and year:
         try:
-            from datetime import datetime
-            if isinstance(receipt_date, str):
-                date_obj = datetime.strptime(receipt_date.split()[0], '%Y-%m-%d')
-                if date_obj.month != int(month) or date_obj.year != int(year):
-                    violations.append("Receipt date inconsistent with month/year")
+            date_obj = _as_date(receipt_date)
+            if date_obj and (date_obj.month != int(month) or date_obj.year != int(year)):
+                violations.append("Receipt date inconsistent with month/year")
         except Exception:
             pass
     
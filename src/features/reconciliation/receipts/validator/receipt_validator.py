@@ -1,6 +1,15 @@
 """AI-powered receipt validation using LangChain ReAct agents."""
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, List
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
@@ -12,32 +21,116 @@ from src.features.reconciliation.receipts.tools import (
     check_logical_consistency,
     check_duplicate,
     check_business_rules,
+    duplicate_key,
 )
-import os
-from dotenv import load_dotenv
+from src.utils.log_helpers import get_logger
+from config.reconciliation_config import (
+    OPENAI_API_KEY,
+    VALIDATION_CACHE_PATH,
+    VALIDATION_CACHE_SIZE,
+    VALIDATION_CACHE_TTL,
+    VALIDATION_WORKERS,
+)
+
+logger = get_logger("lxdb.reconciliation")
+
+# Receipt fields given to the agent; its verdict depends on nothing else (besides the duplicate lookup)
+AGENT_FIELDS = (
+    'ID', 'RECEIPT_NUMBER', 'STATUS', 'AMOUNT', 'MONTH', 'YEAR',
+    'EMPLOYER_ID', 'OFFICE_ID', 'MEMBER_ID',
+    'MAIN_SCHEME_ID', 'SCHEME_ID', 'RECEIPT_TYPE', 'APPORTION_TYPE',
+    'RECEIPT_DATE', 'EMPLOYER_OFFICE_ID', 'PENALTY_ID', 'ADJUSTMENT_ID'
+)
+
+# Agent output parsing, compiled once instead of per receipt
+CONFIDENCE_PATTERN = re.compile(r'(\d+)\s*(?:%|confidence|score)', re.IGNORECASE)
+ISSUE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Missing[^:]*:?\s*([^\n]+)',
+    r'Invalid[^:]*:?\s*([^\n]+)',
+    r'ERROR[^:]*:?\s*([^\n]+)',
+    r'VIOLATION[^:]*:?\s*([^\n]+)',
+))
 
-load_dotenv()
+# On-disk verdict cache, so receipts still unreconciled after a restart skip the agent. Entries
+# outlive the run's reconciliations, so hits are only served after _duplicate_check() passes
+DISK_CACHE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS validation_results (
+        key TEXT PRIMARY KEY,
+        result TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )
+"""
+DISK_CACHE_GET = "SELECT result FROM validation_results WHERE key = ? AND expires_at > ?"
+DISK_CACHE_PUT = "INSERT OR REPLACE INTO validation_results (key, result, expires_at) VALUES (?, ?, ?)"
+
+# Tools that need neither the LLM nor the database; run before the agent as a pre-check
+DETERMINISTIC_TOOLS = (
+    check_receipt_validity,
+    check_employer_assignment,
+    check_logical_consistency,
+    check_business_rules,
+)
 
 
 class ReceiptValidator:
     """Validates receipts using LangChain ReAct agent with validation tools."""
     
-    def __init__(self, db_connection: Optional[OracleConnection] = None, model_name: str = "gpt-4o-mini"):
+    def __init__(self, db_connection: Optional[OracleConnection] = None, model_name: str = "gpt-4o-mini",
+                 max_concurrency: Optional[int] = None):
         """
         Initialize receipt validator.
         
         Args:
             db_connection: Oracle database connection for duplicate checking
             model_name: OpenAI model to use for validation
+            max_concurrency: Receipts validate_batch() / avalidate_batch() validate at once (default VALIDATION_WORKERS)
         """
         self.db_connection = db_connection
+        self.max_concurrency = max_concurrency or VALIDATION_WORKERS
+        # Set from ReceiptExtractor.load_duplicate_index() so duplicate checks skip the per-receipt query
+        self.duplicate_index: Optional[Dict[tuple, int]] = None
+        # Duplicate keys of receipts queued for reconciliation by claim_reconciled()
+        self._claimed: set = set()
+        self._claim_lock = threading.Lock()
         self.model_name = model_name
         self.llm = ChatOpenAI(
             model=model_name,
             temperature=0,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
+            openai_api_key=OPENAI_API_KEY or None
         )
         self.agent = self._create_agent()
+        # Content hash of the verdict-relevant fields -> validation result, LRU-ordered
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Identifiers are left out of the cache key so receipts with the same content share a
+        # verdict; duplicates are rejected by _duplicate_check() before the cache is consulted
+        self._cache_fields = tuple(field for field in AGENT_FIELDS if field not in ('ID', 'RECEIPT_NUMBER'))
+        self._disk_cache = self._open_disk_cache(VALIDATION_CACHE_PATH)
+    
+    @staticmethod
+    def _open_disk_cache(path: str) -> Optional[sqlite3.Connection]:
+        """
+        Open the on-disk verdict cache, creating it if needed.
+        
+        Args:
+            path: SQLite file path; empty disables the disk cache
+            
+        Returns:
+            SQLite connection (shared by all threads, guarded by the cache lock), or None
+        """
+        if not path:
+            return None
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute(DISK_CACHE_SCHEMA)
+            connection.commit()
+            return connection
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("⚠ Validation disk cache disabled (%s): %s", path, e)
+            return None
     
     def _create_agent(self) -> AgentExecutor:
         """Create ReAct agent with validation tools."""
@@ -53,7 +146,7 @@ class ReceiptValidator:
         if self.db_connection:
             duplicate_tool = Tool(
                 name="check_duplicate",
-                func=lambda receipt_data: check_duplicate(receipt_data, self.db_connection),
+                func=lambda receipt_data: check_duplicate.func(receipt_data, self.db_connection, self.duplicate_index),
                 description="Check if receipt is a duplicate of an existing reconciled receipt. Input should be a dictionary with receipt data."
             )
             tools.append(duplicate_tool)
@@ -96,6 +189,41 @@ Thought: {agent_scratchpad}
             max_iterations=10
         )
     
+    def note_reconciled(self, receipt_data: Dict[str, Any]) -> None:
+        """
+        Count a receipt being reconciled in this run in the duplicate index, if one is loaded.
+        
+        Args:
+            receipt_data: Receipt data dictionary
+        """
+        if self.duplicate_index is not None:
+            key = duplicate_key(receipt_data)
+            self.duplicate_index[key] = self.duplicate_index.get(key, 0) + 1
+    
+    def claim_reconciled(self, receipt_data: Dict[str, Any]) -> bool:
+        """
+        Reserve a receipt's duplicate key for reconciliation, unless another receipt already holds it.
+        
+        Receipts are validated concurrently, so two with the same key can both pass the
+        duplicate check before either is reconciled; only the first to claim the key may
+        be reconciled, and it is then counted in the duplicate index like note_reconciled().
+        
+        Args:
+            receipt_data: Receipt data dictionary
+            
+        Returns:
+            True if the receipt may be reconciled, False if it duplicates one that is
+        """
+        key = duplicate_key(receipt_data)
+        with self._claim_lock:
+            index = self.duplicate_index
+            if key in self._claimed or (index is not None and index.get(key, 0)):
+                return False
+            self._claimed.add(key)
+            if index is not None:
+                index[key] = 1
+        return True
+    
     def validate_receipt(self, receipt_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate a receipt using AI agent.
@@ -110,6 +238,15 @@ Thought: {agent_scratchpad}
             - reasoning: Detailed explanation
             - issues: List of issues found
         """
+        rejected = self._precheck(receipt_data) or self._duplicate_check(receipt_data)
+        if rejected is not None:
+            return rejected
+        
+        key = self._cache_key(receipt_data)
+        cached = self._cache_get(key, receipt_data)
+        if cached is not None:
+            return cached
+        
         try:
             # Format receipt data for agent
             receipt_str = self._format_receipt_for_agent(receipt_data)
@@ -120,7 +257,47 @@ Thought: {agent_scratchpad}
             })
             
             # Parse agent response
-            return self._parse_agent_response(result, receipt_data)
+            return self._cache_put(key, self._parse_agent_response(result, receipt_data))
+            
+        except Exception as e:
+            return {
+                "status": "ERROR",
+                "confidence": 0,
+                "reasoning": f"Validation error: {str(e)}",
+                "issues": [f"Validation failed: {str(e)}"]
+            }
+    
+    async def validate_receipt_async(self, receipt_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate a receipt using the AI agent without blocking the event loop.
+        
+        Args:
+            receipt_data: Receipt data dictionary
+            
+        Returns:
+            Dictionary with the same validation results as validate_receipt()
+        """
+        rejected = self._precheck(receipt_data)
+        if rejected is None:
+            if self.duplicate_index is not None:
+                rejected = self._duplicate_check(receipt_data)
+            else:
+                # Without the index the check is a database query, so keep it off the event loop
+                rejected = await asyncio.to_thread(self._duplicate_check, receipt_data)
+        if rejected is not None:
+            return rejected
+        
+        key = self._cache_key(receipt_data)
+        cached = self._cache_get(key, receipt_data)
+        if cached is not None:
+            return cached
+        
+        try:
+            receipt_str = self._format_receipt_for_agent(receipt_data)
+            result = await self.agent.ainvoke({
+                "input": f"Validate this receipt for reconciliation: {receipt_str}"
+            })
+            return self._cache_put(key, self._parse_agent_response(result, receipt_data))
             
         except Exception as e:
             return {
@@ -130,17 +307,125 @@ Thought: {agent_scratchpad}
                 "issues": [f"Validation failed: {str(e)}"]
             }
     
+    def _precheck(self, receipt_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run the deterministic tools, rejecting the receipt without the agent if one finds it invalid.
+        
+        Returns:
+            INVALID validation result, or None if the receipt needs the agent's judgement
+        """
+        try:
+            outputs = [tool.invoke({"receipt_data": receipt_data}) for tool in DETERMINISTIC_TOOLS]
+        except Exception:
+            return None  # let the agent make the call
+        issues = [output[len("INVALID:"):].strip() for output in outputs if output.startswith("INVALID:")]
+        if not issues:
+            return None
+        return {
+            "status": "INVALID",
+            "confidence": 100,
+            "reasoning": "\n".join(outputs),
+            "issues": issues,
+            "receipt_id": receipt_data.get("ID"),
+            "receipt_number": receipt_data.get("RECEIPT_NUMBER")
+        }
+    
+    def _duplicate_check(self, receipt_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Reject the receipt if it duplicates a reconciled one, checked on every call.
+        
+        A duplicate depends on what has been reconciled since, not on the receipt's content,
+        so it is decided here rather than read from the verdict cache; cached verdicts only
+        ever come from receipts that passed this check.
+        
+        Returns:
+            INVALID validation result, or None if the receipt is not a known duplicate
+        """
+        if self.duplicate_index is None and not self.db_connection:
+            return None
+        output = check_duplicate.func(receipt_data, self.db_connection, self.duplicate_index)
+        if not output.startswith("DUPLICATE:"):
+            return None
+        return {
+            "status": "INVALID",
+            "confidence": 100,
+            "reasoning": output,
+            "issues": [output[len("DUPLICATE:"):].strip()],
+            "receipt_id": receipt_data.get("ID"),
+            "receipt_number": receipt_data.get("RECEIPT_NUMBER")
+        }
+    
+    def _cache_key(self, receipt_data: Dict[str, Any]) -> str:
+        """Hash the fields that determine a receipt's verdict, and the model giving it."""
+        content = json.dumps([self.model_name, *(receipt_data.get(field) for field in self._cache_fields)], default=str)
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key: str, receipt_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get a cached verdict, re-labelled with this receipt's identifiers."""
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            else:
+                result = self._disk_get(key)
+                if result is None:
+                    return None
+                self._memory_put(key, result)
+        return {
+            **result,
+            "issues": list(result["issues"]),
+            "receipt_id": receipt_data.get("ID"),
+            "receipt_number": receipt_data.get("RECEIPT_NUMBER")
+        }
+    
+    def _cache_put(self, key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cache a verdict in memory and on disk, evicting the least recently used beyond VALIDATION_CACHE_SIZE.
+        
+        Verdicts that cite a duplicate are not cached: they depend on what was reconciled at the
+        time, which _duplicate_check() re-evaluates on every call instead.
+        """
+        if "DUPLICATE" in result["reasoning"].upper():
+            return result
+        verdict = {field: value for field, value in result.items() if field not in ("receipt_id", "receipt_number")}
+        verdict["issues"] = list(result["issues"])
+        with self._cache_lock:
+            self._memory_put(key, verdict)
+            self._disk_put(key, verdict)
+        return result
+    
+    def _memory_put(self, key: str, verdict: Dict[str, Any]) -> None:
+        """Add a verdict to the in-memory LRU; the caller holds the cache lock."""
+        if VALIDATION_CACHE_SIZE > 0:
+            self._cache[key] = verdict
+            if len(self._cache) > VALIDATION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look a verdict up in the disk cache, ignoring expired entries; the caller holds the cache lock."""
+        if self._disk_cache is None:
+            return None
+        try:
+            row = self._disk_cache.execute(DISK_CACHE_GET, (key, time.time())).fetchone()
+        except sqlite3.Error as e:
+            logger.debug("Validation disk cache read failed: %s", e)
+            return None
+        return json.loads(row[0]) if row else None
+    
+    def _disk_put(self, key: str, verdict: Dict[str, Any]) -> None:
+        """Store a verdict in the disk cache for VALIDATION_CACHE_TTL seconds; the caller holds the cache lock."""
+        if self._disk_cache is None:
+            return
+        try:
+            self._disk_cache.execute(DISK_CACHE_PUT, (key, json.dumps(verdict, default=str), time.time() + VALIDATION_CACHE_TTL))
+            self._disk_cache.commit()
+        except sqlite3.Error as e:
+            logger.debug("Validation disk cache write failed: %s", e)
+    
     def _format_receipt_for_agent(self, receipt_data: Dict[str, Any]) -> str:
         """Format receipt data as string for agent input."""
-        key_fields = [
-            'ID', 'RECEIPT_NUMBER', 'STATUS', 'AMOUNT', 'MONTH', 'YEAR',
-            'EMPLOYER_ID', 'OFFICE_ID', 'MEMBER_ID',
-            'MAIN_SCHEME_ID', 'SCHEME_ID', 'RECEIPT_TYPE', 'APPORTION_TYPE',
-            'RECEIPT_DATE', 'EMPLOYER_OFFICE_ID', 'PENALTY_ID', 'ADJUSTMENT_ID'
-        ]
-        
         formatted = []
-        for field in key_fields:
+        for field in AGENT_FIELDS:
             value = receipt_data.get(field)
             if value is not None:
                 formatted.append(f"{field}: {value}")
@@ -152,30 +437,23 @@ Thought: {agent_scratchpad}
         output = agent_result.get("output", "")
         
         # Extract status
+        output_upper = output.upper()
         status = "NEEDS_REVIEW"
-        if "VALID" in output.upper() and "INVALID" not in output.upper():
+        if "VALID" in output_upper and "INVALID" not in output_upper:
             status = "VALID"
-        elif "INVALID" in output.upper():
+        elif "INVALID" in output_upper:
             status = "INVALID"
         
         # Extract confidence (look for number 0-100)
-        import re
-        confidence_match = re.search(r'(\d+)\s*(?:%|confidence|score)', output, re.IGNORECASE)
+        confidence_match = CONFIDENCE_PATTERN.search(output)
         confidence = int(confidence_match.group(1)) if confidence_match else 50
         
         # Extract issues
         issues = []
         if "INVALID" in output or "ERROR" in output or "VIOLATION" in output:
             # Try to extract specific issues
-            issue_patterns = [
-                r'Missing[^:]*:?\s*([^\n]+)',
-                r'Invalid[^:]*:?\s*([^\n]+)',
-                r'ERROR[^:]*:?\s*([^\n]+)',
-                r'VIOLATION[^:]*:?\s*([^\n]+)',
-            ]
-            for pattern in issue_patterns:
-                matches = re.findall(pattern, output, re.IGNORECASE)
-                issues.extend(matches)
+            for pattern in ISSUE_PATTERNS:
+                issues.extend(pattern.findall(output))
         
         return {
             "status": status,
@@ -186,19 +464,37 @@ Thought: {agent_scratchpad}
             "receipt_number": receipt_data.get("RECEIPT_NUMBER")
         }
     
-    def validate_batch(self, receipts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def validate_batch(self, receipts: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Validate multiple receipts.
         
+        Runs avalidate_batch() on a new event loop; from async code, await that instead.
+        
         Args:
-            receipts: List of receipt dictionaries
+            receipts: Receipt dictionaries, e.g. a list or ReceiptExtractor.iter_unreconciled_receipts()
             
         Returns:
-            List of validation results
+            List of validation results, in the same order as receipts
         """
-        results = []
-        for receipt in receipts:
-            result = self.validate_receipt(receipt)
-            results.append(result)
-        return results
-
+        return asyncio.run(self.avalidate_batch(receipts))
+    
+    async def avalidate_batch(self, receipts: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validate multiple receipts without blocking the event loop.
+        
+        Up to max_concurrency agent round-trips are in flight at once on the one event
+        loop, so they overlap instead of running back to back.
+        
+        Args:
+            receipts: Receipt dictionaries, e.g. a list or ReceiptExtractor.iter_unreconciled_receipts()
+            
+        Returns:
+            List of validation results, in the same order as receipts
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def validate(receipt_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.validate_receipt_async(receipt_data)
+        
+        return list(await asyncio.gather(*(validate(receipt_data) for receipt_data in receipts)))
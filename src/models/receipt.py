@@ -1,11 +1,41 @@
 """Receipt data model based on actual RECEIPT_DETAILS table schema."""
 
-from typing import Optional, Dict, Any
+from typing import Callable, Iterable, List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 
+# String formats accepted by Receipt._parse_date / _parse_timestamp, in the order they are tried
+DATE_FORMATS = ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%d-%m-%Y', '%m/%d/%Y', '%d/%m/%Y')
+TIMESTAMP_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d', '%d-%m-%Y %H:%M:%S')
 
-@dataclass
+# Receipt attributes filled by Receipt.from_dict, grouped by converter; the column is the upper-cased name
+_INT_FIELDS = (
+    'id', 'receipt_detail_no', 'employer_id', 'office_id', 'member_id', 'month', 'year',
+    'main_scheme_id', 'scheme_id', 'penalty_id', 'adjustment_id', 'updated_by', 'deleted_by',
+)
+_FLOAT_FIELDS = ('amount', 'memsalary_amount')
+_STR_FIELDS = ('reconciled_by', 'created_by', 'source_pro', 'dsis_flag', 'eoffice_reference', 'employer_office_id')
+_TS_FIELDS = ('reconciled_at', 'created_at', 'updated_at', 'deleted_at')
+
+
+@lru_cache(maxsize=4096)
+def _strptime(value: str, formats: Tuple[str, ...]) -> Optional[datetime]:
+    """
+    Parse value with the first of formats that matches, always tried in the given order.
+    
+    Memoized by value, since date strings repeat heavily across receipts; the order is fixed
+    so an ambiguous value like '03/04/2024' parses the same way whatever came before it.
+    """
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@dataclass(slots=True)
 class Receipt:
     """Represents a receipt record from CFMSPRO.RECEIPT_DETAILS."""
     
@@ -52,43 +82,58 @@ class Receipt:
         Returns:
             Receipt instance
         """
-        # Map database column names (uppercase) to Python attributes
-        receipt = cls(
-            id=cls._safe_int(data.get('ID') or data.get('id')),
-            receipt_number=str(data.get('RECEIPT_NUMBER') or data.get('receipt_number', '')),
-            receipt_detail_no=cls._safe_int(data.get('RECEIPT_DETAIL_NO') or data.get('receipt_detail_no')),
-            employer_id=cls._safe_int(data.get('EMPLOYER_ID') or data.get('employer_id')),
-            office_id=cls._safe_int(data.get('OFFICE_ID') or data.get('office_id')),
-            member_id=cls._safe_int(data.get('MEMBER_ID') or data.get('member_id')),
-            month=cls._safe_int(data.get('MONTH') or data.get('month')),
-            year=cls._safe_int(data.get('YEAR') or data.get('year')),
-            main_scheme_id=cls._safe_int(data.get('MAIN_SCHEME_ID') or data.get('main_scheme_id')),
-            scheme_id=cls._safe_int(data.get('SCHEME_ID') or data.get('scheme_id')),
-            amount=cls._safe_float(data.get('AMOUNT') or data.get('amount')),
-            status=str(data.get('STATUS') or data.get('status', 'U')).upper(),
-            receipt_type=str(data.get('RECEIPT_TYPE') or data.get('receipt_type', '')),
-            apportion_type=str(data.get('APPORTION_TYPE') or data.get('apportion_type', '')),
-            penalty_id=cls._safe_int(data.get('PENALTY_ID') or data.get('penalty_id')),
-            adjustment_id=cls._safe_int(data.get('ADJUSTMENT_ID') or data.get('adjustment_id')),
-            reconciled_by=data.get('RECONCILED_BY') or data.get('reconciled_by'),
-            created_by=data.get('CREATED_BY') or data.get('created_by'),
-            source_pro=data.get('SOURCE_PRO') or data.get('source_pro'),
-            updated_by=cls._safe_int(data.get('UPDATED_BY') or data.get('updated_by')),
-            deleted_by=cls._safe_int(data.get('DELETED_BY') or data.get('deleted_by')),
-            memsalary_amount=cls._safe_float(data.get('MEMSALARY_AMOUNT') or data.get('memsalary_amount')),
-            dsis_flag=data.get('DSIS_FLAG') or data.get('dsis_flag'),
-            eoffice_reference=data.get('EOFFICE_REFERENCE') or data.get('eoffice_reference'),
-            employer_office_id=data.get('EMPLOYER_OFFICE_ID') or data.get('employer_office_id'),
-        )
+        # Normalize column names once so each field is a single lookup
+        row = {key.upper(): value for key, value in data.items()} if data else {}
+        return cls._from_row(row)
+    
+    @classmethod
+    def from_records(cls, rows: Iterable[Dict[str, Any]]) -> List['Receipt']:
+        """
+        Create Receipt instances from many database rows.
         
-        # Handle timestamp fields
-        receipt.receipt_date = cls._parse_date(data.get('RECEIPT_DATE') or data.get('receipt_date'))
-        receipt.reconciled_at = cls._parse_timestamp(data.get('RECONCILED_AT') or data.get('reconciled_at'))
-        receipt.created_at = cls._parse_timestamp(data.get('CREATED_AT') or data.get('created_at'))
-        receipt.updated_at = cls._parse_timestamp(data.get('UPDATED_AT') or data.get('updated_at'))
-        receipt.deleted_at = cls._parse_timestamp(data.get('DELETED_AT') or data.get('deleted_at'))
+        Rows from one query share their column names, so they are checked once and
+        rows that are already keyed by upper-case column names are used as-is rather
+        than copied per row. Date strings repeat heavily across receipts, so each
+        distinct value is parsed once per call.
+        
+        Args:
+            rows: Dictionaries from database query results
+            
+        Returns:
+            Receipt instances, in row order
+        """
+        parse_date = lru_cache(maxsize=None)(cls._parse_date)
+        parse_timestamp = lru_cache(maxsize=None)(cls._parse_timestamp)
+        receipts = []
+        columns = None
+        upper = False
+        for data in rows:
+            if columns is None or data.keys() != columns:
+                columns = data.keys()
+                upper = all(key == key.upper() for key in columns)
+            if not upper:
+                data = {key.upper(): value for key, value in data.items()}
+            receipts.append(cls._from_row(data, parse_date, parse_timestamp))
+        return receipts
+    
+    @classmethod
+    def _from_row(cls, row: Dict[str, Any], parse_date: Optional[Callable[[Any], Optional[datetime]]] = None,
+                  parse_timestamp: Optional[Callable[[Any], Optional[datetime]]] = None) -> 'Receipt':
+        """Create a Receipt from a row keyed by upper-case column names."""
+        parse_date = parse_date or cls._parse_date
+        parse_timestamp = parse_timestamp or cls._parse_timestamp
+        # Map database column names (uppercase) to Python attributes
+        fields = {name: cls._safe_int(row.get(name.upper())) for name in _INT_FIELDS}
+        fields.update((name, cls._safe_float(row.get(name.upper()))) for name in _FLOAT_FIELDS)
+        fields.update((name, row.get(name.upper())) for name in _STR_FIELDS)
+        fields.update((name, parse_timestamp(row.get(name.upper()))) for name in _TS_FIELDS)
+        fields['receipt_number'] = str(row.get('RECEIPT_NUMBER') or '')
+        fields['receipt_date'] = parse_date(row.get('RECEIPT_DATE'))
+        fields['status'] = str(row.get('STATUS') or 'U').upper()
+        fields['receipt_type'] = str(row.get('RECEIPT_TYPE') or '')
+        fields['apportion_type'] = str(row.get('APPORTION_TYPE') or '')
         
-        return receipt
+        return cls(**fields)
     
     @staticmethod
     def _safe_float(value: Any) -> Optional[float]:
@@ -110,41 +155,27 @@ class Receipt:
         except (ValueError, TypeError):
             return None
     
-    @staticmethod
-    def _parse_date(value: Any) -> Optional[datetime]:
+    @classmethod
+    def _parse_date(cls, value: Any) -> Optional[datetime]:
         """Parse date value to datetime."""
         if value is None:
             return None
         if isinstance(value, datetime):
             return value
-        try:
-            if isinstance(value, str):
-                for fmt in ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%d-%m-%Y', '%m/%d/%Y', '%d/%m/%Y']:
-                    try:
-                        return datetime.strptime(value, fmt)
-                    except ValueError:
-                        continue
-            return None
-        except Exception:
+        if not isinstance(value, str):
             return None
+        return _strptime(value, DATE_FORMATS)
     
-    @staticmethod
-    def _parse_timestamp(value: Any) -> Optional[datetime]:
+    @classmethod
+    def _parse_timestamp(cls, value: Any) -> Optional[datetime]:
         """Parse timestamp value to datetime."""
         if value is None:
             return None
         if isinstance(value, datetime):
             return value
-        try:
-            if isinstance(value, str):
-                for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d', '%d-%m-%Y %H:%M:%S']:
-                    try:
-                        return datetime.strptime(value, fmt)
-                    except ValueError:
-                        continue
-            return None
-        except Exception:
+        if not isinstance(value, str):
             return None
+        return _strptime(value, TIMESTAMP_FORMATS)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert Receipt to dictionary."""
@@ -1,18 +1,38 @@
 """Utility functions and helpers."""
 
 from .db_helpers import (
+    AdaptiveBatchSize,
+    cached_rows,
+    invalidate_metadata_cache,
     exec_query,
+    exec_query_one,
+    iter_rows,
     exec_update,
+    exec_many,
+    exec_checked_out,
     safe_disconnect,
     check_connection,
     safe_execute,
+    db_op,
+    is_ddl,
 )
+from .log_helpers import get_logger
 
 __all__ = [
+    "AdaptiveBatchSize",
+    "cached_rows",
+    "invalidate_metadata_cache",
     "exec_query",
+    "exec_query_one",
+    "iter_rows",
     "exec_update",
+    "exec_many",
+    "exec_checked_out",
     "safe_disconnect",
     "check_connection",
     "safe_execute",
+    "db_op",
+    "is_ddl",
+    "get_logger",
 ]
 
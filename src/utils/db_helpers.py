@@ -1,6 +1,126 @@
 """Database helper functions for common operations."""
 
-from typing import Optional, List, Any, Callable
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+from src.utils.log_helpers import get_logger
+
+logger = get_logger("lxdb.db")
+
+# Round-trip latency AdaptiveBatchSize steers towards, in seconds
+ADAPTIVE_BATCH_TARGET_SECONDS = 0.5
+
+# Leading keywords of statements that change schema objects (see is_ddl)
+DDL_KEYWORDS = ("CREATE", "ALTER", "DROP", "TRUNCATE", "RENAME", "COMMENT")
+
+# How long cached_rows keeps a result, in seconds, and how many results it keeps at most
+RESULT_CACHE_TTL = 60.0
+RESULT_CACHE_SIZE = 128
+
+# (scope, SQL text) -> (expiry on the monotonic clock, rows), least recently used first
+_result_cache: OrderedDict[tuple, tuple[float, tuple]] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def is_ddl(query: str) -> bool:
+    """Check whether a statement is DDL, after which cached statements may be stale."""
+    first_word = query.lstrip().split(None, 1)[0] if query.strip() else ""
+    return first_word.upper() in DDL_KEYWORDS
+
+
+def cached_rows(scope: Any, query: str, load: Callable[[], list | None],
+                ttl: float = RESULT_CACHE_TTL) -> list | None:
+    """
+    Get the rows of a read-only query from the process-wide result cache, loading them on a miss.
+    
+    Meant for small catalog queries (schemas, table lists) whose results only change with
+    DDL; is_ddl statements run through a connection call invalidate_metadata_cache().
+    Failed loads (None) are not cached.
+    
+    Args:
+        scope: Key separating databases, e.g. a connection's pool key
+        query: SQL text, used (stripped) as the rest of the key
+        load: Runs the query and returns its rows, or None on error
+        ttl: Seconds a loaded result stays valid
+        
+    Returns:
+        A fresh list of the result rows, or None if load() failed
+    """
+    key = (scope, query.strip())
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            _result_cache.move_to_end(key)
+            return list(entry[1])
+    rows = load()
+    if rows is None:
+        return None
+    with _result_cache_lock:
+        _result_cache[key] = (time.monotonic() + ttl, tuple(rows))
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+    return list(rows)
+
+
+def invalidate_metadata_cache() -> None:
+    """Drop every result held by cached_rows, e.g. after DDL changed the catalog."""
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
+class AdaptiveBatchSize:
+    """
+    Batch size for repeated database round-trips, tuned to the observed latency.
+    
+    The size doubles while batches come back in under half the target time and halves
+    when they take over twice as long, so round-trips stay few under light load without
+    one batch growing unbounded under heavy load.
+    """
+    
+    __slots__ = ("size", "minimum", "maximum", "target", "smoothing", "_latency")
+    
+    def __init__(self, initial: int, minimum: int, maximum: int,
+                 target: float = ADAPTIVE_BATCH_TARGET_SECONDS, smoothing: float = 0.3):
+        """
+        Args:
+            initial: Starting batch size (widens the bounds if outside them)
+            minimum: Smallest size it shrinks to
+            maximum: Largest size it grows to
+            target: Round-trip latency to aim for, in seconds
+            smoothing: Weight of the newest latency in the moving average
+        """
+        self.size = initial
+        self.minimum = min(minimum, initial)
+        self.maximum = max(maximum, initial)
+        self.target = target
+        self.smoothing = smoothing
+        self._latency: float | None = None
+    
+    def record(self, elapsed: float) -> int:
+        """
+        Record how long the last batch took and resize if the average is off target.
+        
+        Args:
+            elapsed: Seconds the round-trip for a batch of the current size took
+            
+        Returns:
+            Batch size to use next
+        """
+        latency = self._latency
+        latency = elapsed if latency is None else self.smoothing * elapsed + (1 - self.smoothing) * latency
+        if latency < self.target / 2 and self.size < self.maximum:
+            self.size, latency = min(self.size * 2, self.maximum), None
+        elif latency > self.target * 2 and self.size > self.minimum:
+            self.size, latency = max(self.size // 2, self.minimum), None
+        # Latencies measured at the old size say nothing about the new one
+        self._latency = latency
+        return self.size
 
 
 def safe_execute(func: Callable, error_msg: str) -> tuple:
@@ -8,51 +128,210 @@ def safe_execute(func: Callable, error_msg: str) -> tuple:
     try:
         return True, func()
     except Exception as e:
-        print(error_msg.format(str(e)))
+        logger.error(error_msg.format(e))
         return False, None
 
 
-def exec_query(conn, cursor_func, is_connected_func, conn_name: str, db_type: str, query: str) -> Optional[List]:
-    """Execute a SELECT query."""
+def db_op(db_type: str, driver_exc: type[BaseException] | tuple[type[BaseException], ...],
+          default: Any = None) -> Callable:
+    """
+    Decorate a connection method so failures are classified and logged in one place.
+    
+    Driver errors are logged as database errors; anything else is logged with its
+    traceback as unexpected. Either way the method returns default.
+    
+    Args:
+        db_type: Database name used in log messages, e.g. "MySQL"
+        driver_exc: Exception class (or tuple) raised by the driver
+        default: Value returned when the method raises
+    """
+    def deco(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            except driver_exc as e:
+                logger.error("✗ %s database error (%s): %s", db_type, self.connection_name, e)
+            except Exception:
+                logger.exception("✗ Unexpected %s error (%s)", db_type, self.connection_name)
+            return default
+        return wrapper
+    return deco
+
+
+def exec_query(conn, cursor_func, is_connected_func, conn_name: str, db_type: str, query: str,
+               close_cursor: bool = True, on_error: Callable | None = None,
+               arraysize: int | None = None) -> list | None:
+    """
+    Execute a SELECT query and fetch the whole result into a list.
+    
+    Meant for bounded results (counts, lookups, first-N lists); for unbounded scans use
+    iter_rows, which keeps only one batch of rows in client memory at a time.
+    
+    Pass close_cursor=False when cursor_func hands out a reused cursor; on_error(exc) is called
+    when the driver raises, e.g. to invalidate a cached liveness check. arraysize, if given,
+    sets how many rows the driver fetches per round-trip while reading the result.
+    """
     if not is_connected_func():
-        print(f"✗ Not connected to {db_type} database '{conn_name}'. Please connect first.")
+        logger.error("✗ Not connected to %s database '%s'. Please connect first.", db_type, conn_name)
         return None
     try:
         cursor = cursor_func()
+        if arraysize:
+            cursor.arraysize = arraysize
         cursor.execute(query)
         results = cursor.fetchall()
-        cursor.close()
+        if close_cursor:
+            cursor.close()
         return results
     except Exception as e:
-        print(f"✗ {db_type} query error ({conn_name}): {str(e)}")
+        logger.error("✗ %s query error (%s): %s", db_type, conn_name, e)
+        if on_error:
+            on_error(e)
         return None
 
 
-def exec_update(conn, cursor_func, commit_func, rollback_func, is_connected_func, conn_name: str, db_type: str, query: str, params: Optional[tuple]) -> bool:
+def exec_query_one(conn, cursor_func, is_connected_func, conn_name: str, db_type: str, query: str,
+                   close_cursor: bool = True, on_error: Callable | None = None) -> tuple | None:
+    """
+    Execute a SELECT query and fetch only its first row.
+    
+    For existence probes and single-row results (counts, lookups), so the rest of the
+    result is never transferred. Returns None if there is no row or on error.
+    """
+    if not is_connected_func():
+        logger.error("✗ Not connected to %s database '%s'. Please connect first.", db_type, conn_name)
+        return None
+    try:
+        cursor = cursor_func()
+        cursor.execute(query)
+        row = cursor.fetchone()
+        if close_cursor:
+            cursor.close()
+        return row
+    except Exception as e:
+        logger.error("✗ %s query error (%s): %s", db_type, conn_name, e)
+        if on_error:
+            on_error(e)
+        return None
+
+
+def iter_rows(conn, cursor_func, is_connected_func, conn_name: str, db_type: str, query: str,
+              arraysize: int = 10000, on_error: Callable | None = None) -> Iterator[tuple]:
+    """
+    Execute a SELECT query and yield rows as they are fetched, arraysize rows per round-trip.
+    
+    The streaming counterpart of exec_query for unbounded scans (e.g. a whole table), so
+    memory use stays at one batch however many rows match.
+    """
+    if not is_connected_func():
+        logger.error("✗ Not connected to %s database '%s'. Please connect first.", db_type, conn_name)
+        return
+    cursor = None
+    try:
+        cursor = cursor_func()
+        cursor.arraysize = arraysize
+        cursor.execute(query)
+        while rows := cursor.fetchmany(arraysize):
+            yield from rows
+    except Exception as e:
+        logger.error("✗ %s query error (%s): %s", db_type, conn_name, e)
+        if on_error:
+            on_error(e)
+    finally:
+        if cursor is not None:
+            cursor.close()
+
+
+def exec_update(conn, cursor_func, commit_func, rollback_func, is_connected_func, conn_name: str, db_type: str, query: str, params: tuple | None,
+                close_cursor: bool = True, on_error: Callable | None = None) -> bool:
     """Execute an INSERT/UPDATE/DELETE query."""
     if not is_connected_func():
-        print(f"✗ Not connected to {db_type} database '{conn_name}'. Please connect first.")
+        logger.error("✗ Not connected to %s database '%s'. Please connect first.", db_type, conn_name)
         return False
     try:
         cursor = cursor_func()
         cursor.execute(query, params) if params else cursor.execute(query)
         commit_func()
-        cursor.close()
+        if close_cursor:
+            cursor.close()
         return True
     except Exception as e:
-        print(f"✗ {db_type} update error ({conn_name}): {str(e)}")
+        logger.error("✗ %s update error (%s): %s", db_type, conn_name, e)
+        if on_error:
+            on_error(e)
         rollback_func()
         return False
 
 
+def exec_many(conn, cursor_func, commit_func, rollback_func, is_connected_func, conn_name: str, db_type: str, query: str,
+              params_seq: Iterable[tuple], chunk_size: int = 1000, executemany_func: Callable | None = None,
+              close_cursor: bool = True, on_error: Callable | None = None) -> int:
+    """
+    Execute an INSERT/UPDATE/DELETE query once per parameter tuple, in chunks, with a single commit.
+    
+    executemany_func(cursor, query, chunk) may override how a chunk is sent and returns the
+    number of rows that succeeded; by default the chunk goes through cursor.executemany().
+    Returns the number of parameter rows executed, or -1 on error (after rolling back).
+    """
+    if not is_connected_func():
+        logger.error("✗ Not connected to %s database '%s'. Please connect first.", db_type, conn_name)
+        return -1
+    try:
+        cursor = cursor_func()
+        params_iter = iter(params_seq)
+        executed = 0
+        while chunk := list(islice(params_iter, chunk_size)):
+            if executemany_func:
+                executed += executemany_func(cursor, query, chunk)
+            else:
+                cursor.executemany(query, chunk)
+                executed += len(chunk)
+        commit_func()
+        if close_cursor:
+            cursor.close()
+        return executed
+    except Exception as e:
+        logger.error("✗ %s update error (%s): %s", db_type, conn_name, e)
+        if on_error:
+            on_error(e)
+        rollback_func()
+        return -1
+
+
+def exec_checked_out(checkout_func, conn_name: str, db_type: str, query: str, params: tuple | None = None,
+                     fetch: bool = True) -> Any:
+    """
+    Run one statement on a connection borrowed from checkout_func() for that statement only.
+    
+    Used by the async variants, which run on worker threads and must not share the
+    connection's own session. Returns the fetched rows (fetch=True) or True after commit,
+    and None/False on error.
+    """
+    try:
+        with checkout_func() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params) if params else cursor.execute(query)
+                if fetch:
+                    return cursor.fetchall()
+                conn.commit()
+                return True
+            finally:
+                cursor.close()
+    except Exception as e:
+        logger.error("✗ %s %s error (%s): %s", db_type, "query" if fetch else "update", conn_name, e)
+        return None if fetch else False
+
+
 def safe_disconnect(conn, close_func, conn_name: str, db_type: str):
     """Safely disconnect from database."""
     if conn:
         try:
             close_func()
-            print(f"✓ {db_type} connection '{conn_name}' closed")
+            logger.debug("✓ %s connection '%s' closed", db_type, conn_name)
         except Exception as e:
-            print(f"✗ Error closing {db_type} connection ({conn_name}): {str(e)}")
+            logger.error("✗ Error closing %s connection (%s): %s", db_type, conn_name, e)
 
 
 def check_connection(conn, check_func: Callable) -> bool:
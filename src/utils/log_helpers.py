@@ -0,0 +1,66 @@
+"""Logging helpers for database and reconciliation diagnostics."""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from config.reconciliation_config import LOG_LEVEL
+
+ROOT_LOGGER_NAME = "lxdb"
+
+_configure_lock = threading.Lock()
+_configured = False
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that writes to whatever sys.stdout is when a record is emitted."""
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass  # always follow sys.stdout, which may be swapped after configuration
+
+
+def _configure_root() -> None:
+    """
+    Attach a queued stdout handler to the package root logger once per process.
+    
+    Logging calls only enqueue the record; a listener thread formats and writes it, so
+    callers never block on stdout. The queue is drained at interpreter exit.
+    """
+    global _configured
+    with _configure_lock:
+        if _configured:
+            return
+        stream = _StdoutHandler()
+        stream.setFormatter(logging.Formatter("%(message)s"))
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        # Records are written as they arrive, so progress lines are not held back
+        listener = logging.handlers.QueueListener(records, stream)
+        listener.start()
+        # Drains the queue before logging's own shutdown hook (registered earlier) runs
+        atexit.register(listener.stop)
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        root.addHandler(logging.handlers.QueueHandler(records))
+        root.setLevel(LOG_LEVEL.upper())
+        root.propagate = False
+        _configured = True
+
+
+def get_logger(name: str = ROOT_LOGGER_NAME) -> logging.Logger:
+    """
+    Get a logger under the package root logger.
+    
+    Args:
+        name: Dotted logger name, e.g. "lxdb.db"
+        
+    Returns:
+        Logger whose records go through the shared queued handler
+    """
+    _configure_root()
+    return logging.getLogger(name)
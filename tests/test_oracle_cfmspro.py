@@ -1,5 +1,7 @@
 """Simple test for Oracle database connection and CFMSPRO schema access."""
 
+import asyncio
+import re
 import sys
 from pathlib import Path
 
@@ -8,6 +10,39 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database import OracleConnection
 
+# Row count of one CFMSPRO table; the name is a catalog value checked against
+# SIMPLE_IDENTIFIER before being spliced in, since identifiers cannot be bound
+TABLE_COUNT_QUERY = "SELECT COUNT(*) FROM CFMSPRO.{table}"
+SIMPLE_IDENTIFIER = re.compile(r"^[A-Z][A-Z0-9_$#]*$")
+
+# Schema list, CFMSPRO table count and first 10 CFMSPRO tables in one round-trip;
+# rows are (kind, name, table_count), partitioned by kind in Python
+CATALOG_PROBE_QUERY = """
+    SELECT 'COUNT' AS kind, NULL AS name, COUNT(*) AS table_count
+    FROM all_tables
+    WHERE owner = 'CFMSPRO'
+    UNION ALL
+    SELECT 'SCHEMA', username, NULL
+    FROM all_users
+    UNION ALL
+    SELECT 'TABLE', table_name, NULL
+    FROM (
+        SELECT table_name, ROW_NUMBER() OVER (ORDER BY table_name) AS rn
+        FROM all_tables
+        WHERE owner = 'CFMSPRO'
+    )
+    WHERE rn <= 10
+    ORDER BY 1, 2
+"""
+
+
+async def _run_independent_queries(oracle: OracleConnection) -> tuple:
+    """Run the liveness check on the test connection and the catalog probe on a second pooled session, concurrently."""
+    return await asyncio.gather(
+        asyncio.to_thread(oracle.is_connected),
+        oracle.aexecute_query_cached(CATALOG_PROBE_QUERY),
+    )
+
 
 def test_oracle_connection():
     """Test Oracle database connection."""
@@ -38,33 +73,31 @@ def test_oracle_connection():
     
     # Test 2: Check connection status
     print("\n[Test 2] Checking connection status...")
-    # Try a simple query to verify connection
+    # Ping the session to verify the connection (no SQL to parse); the catalog probes
+    # for tests 3-6 do not depend on it, so they are fetched at the same time
     try:
-        test_query = oracle.execute_query("SELECT 1 FROM DUAL")
-        if test_query:
+        alive, probe = asyncio.run(_run_independent_queries(oracle))
+        if alive:
             print("✓ PASSED: Connection is active and responding")
         else:
-            print("⚠ WARNING: Connection check query returned no results")
+            print("⚠ WARNING: Connection did not answer the ping")
     except Exception as e:
         print(f"✗ FAILED: Connection check failed: {str(e)}")
         oracle.disconnect()
         return False
     
+    probe = probe or []
+    schemas = [name for kind, name, _ in probe if kind == 'SCHEMA']
+    tables = [name for kind, name, _ in probe if kind == 'TABLE']
+    table_counts = [count for kind, _, count in probe if kind == 'COUNT']
+    
     # Test 3: List all schemas in the database
     print("\n[Test 3] Listing all schemas in the database...")
     try:
-        schemas_query = """
-            SELECT DISTINCT username as schema_name
-            FROM all_users
-            ORDER BY username
-        """
-        schemas = oracle.execute_query(schemas_query)
-        
         if schemas and len(schemas) > 0:
             print(f"✓ PASSED: Found {len(schemas)} schemas in the database")
             print(f"\n  Showing all schemas:")
-            for schema in schemas:
-                schema_name = schema[0]
+            for schema_name in schemas:
                 # Highlight CFMSPRO if found
                 marker = " ← CFMSPRO schema" if schema_name.upper() == "CFMSPRO" else ""
                 print(f"  - {schema_name}{marker}")
@@ -78,16 +111,11 @@ def test_oracle_connection():
     # Test 4: Access CFMSPRO schema
     print("\n[Test 3] Testing access to CFMSPRO schema...")
     try:
-        # Query to check if schema exists and we have access
-        schema_query = """
-            SELECT COUNT(*) as table_count 
-            FROM all_tables 
-            WHERE owner = 'CFMSPRO'
-        """
-        result = oracle.execute_query(schema_query)
+        # Check if schema exists and we have access
+        result = table_counts
         
         if result and len(result) > 0:
-            table_count = result[0][0]
+            table_count = result[0]
             print(f"✓ PASSED: CFMSPRO schema accessible. Found {table_count} tables")
         else:
             print("✗ FAILED: Could not access CFMSPRO schema or schema does not exist")
@@ -101,19 +129,10 @@ def test_oracle_connection():
     # Test 5: List tables in CFMSPRO schema
     print("\n[Test 4] Listing tables in CFMSPRO schema...")
     try:
-        tables_query = """
-            SELECT table_name 
-            FROM all_tables 
-            WHERE owner = 'CFMSPRO' 
-            ORDER BY table_name
-            FETCH FIRST 10 ROWS ONLY
-        """
-        tables = oracle.execute_query(tables_query)
-        
         if tables and len(tables) > 0:
             print(f"✓ PASSED: Found {len(tables)} tables (showing first 10):")
-            for table in tables:
-                print(f"  - {table[0]}")
+            for table_name in tables:
+                print(f"  - {table_name}")
         else:
             print("⚠ WARNING: No tables found in CFMSPRO schema")
     except Exception as e:
@@ -125,24 +144,19 @@ def test_oracle_connection():
     print("\n[Test 5] Testing query on CFMSPRO schema table...")
     try:
         # Get first table name
-        first_table_query = """
-            SELECT table_name 
-            FROM all_tables 
-            WHERE owner = 'CFMSPRO' 
-            AND ROWNUM = 1
-        """
-        first_table_result = oracle.execute_query(first_table_query)
+        first_table_result = tables[:1]
         
         if first_table_result and len(first_table_result) > 0:
-            table_name = first_table_result[0][0]
+            table_name = first_table_result[0]
             print(f"  Testing query on table: CFMSPRO.{table_name}")
             
             # Try to get row count
-            count_query = f"SELECT COUNT(*) FROM CFMSPRO.{table_name}"
-            count_result = oracle.execute_query(count_query)
+            count_result = None
+            if SIMPLE_IDENTIFIER.match(table_name):
+                count_result = oracle.execute_query_one(TABLE_COUNT_QUERY.format(table=table_name))
             
             if count_result:
-                row_count = count_result[0][0]
+                row_count = count_result[0]
                 print(f"✓ PASSED: Successfully queried CFMSPRO.{table_name} ({row_count} rows)")
             else:
                 print(f"⚠ WARNING: Could not query CFMSPRO.{table_name}")
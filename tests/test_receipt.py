@@ -0,0 +1,19 @@
+"""Tests for the Receipt model's date parsing."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.receipt import Receipt
+
+
+def test_ambiguous_date_parses_the_same_after_other_formats():
+    """An ambiguous date resolves by DATE_FORMATS order, not by the format of the previous value."""
+    before = Receipt._parse_date('03/04/2024')
+    assert Receipt._parse_date('25/12/2024') == datetime(2024, 12, 25)
+    after = Receipt._parse_date('03/04/2024')
+    
+    assert before == after == datetime(2024, 3, 4)
@@ -0,0 +1,31 @@
+"""Tests for receipt reconciliation bookkeeping (the agent is replaced, so no LLM or database is required)."""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import SQLiteConnection
+from src.features.reconciliation.receipt_reconciler import ReceiptReconciler
+from src.features.reconciliation.receipts.validator import receipt_validator
+from tests.test_receipt_validator import _FakeAgent, _receipt
+
+
+def test_same_key_receipts_in_one_batch_reconcile_once(monkeypatch):
+    """Two same-key receipts validated concurrently both pass validation, but only the first is reconciled."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(receipt_validator, "VALIDATION_CACHE_PATH", "")
+    reconciler = ReceiptReconciler(db_connection=SQLiteConnection(connection_name="test_reconciler"))
+    reconciler.validator.agent = _FakeAgent()
+    reconciler.validator.duplicate_index = {}
+    
+    results = reconciler._new_results()
+    to_reconcile, pending_details = [], []
+    for receipt_data, validation_result in reconciler._validate_concurrently([_receipt(1), _receipt(2)]):
+        assert validation_result["status"] == "VALID"
+        reconciler._record_result(receipt_data, validation_result, results, to_reconcile, pending_details)
+    
+    assert to_reconcile == [("R", 1)]
+    assert results["failed"] == 1
+    assert results["details"][1]["status"] == "INVALID"
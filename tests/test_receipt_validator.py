@@ -0,0 +1,67 @@
+"""Tests for receipt validator caching (the agent is replaced, so no LLM or database is required)."""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.features.reconciliation.receipts.validator import receipt_validator
+from src.features.reconciliation.receipts.validator.receipt_validator import ReceiptValidator
+
+
+class _FakeAgent:
+    """Stands in for the AgentExecutor, approving every receipt and counting the calls."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def invoke(self, inputs):
+        self.calls += 1
+        return {"output": "Status: VALID\nConfidence: 95%"}
+
+
+def _receipt(receipt_id: int) -> dict:
+    return {
+        'ID': receipt_id, 'RECEIPT_NUMBER': 'RC-1001', 'STATUS': 'U', 'AMOUNT': 1500.0,
+        'MONTH': 3, 'YEAR': 2024, 'EMPLOYER_ID': 42, 'OFFICE_ID': 7, 'MEMBER_ID': 9,
+        'MAIN_SCHEME_ID': 1, 'SCHEME_ID': 2, 'RECEIPT_TYPE': '1', 'APPORTION_TYPE': 'Normal',
+        'RECEIPT_DATE': '2024-03-15', 'EMPLOYER_OFFICE_ID': 7, 'PENALTY_ID': None, 'ADJUSTMENT_ID': None,
+    }
+
+
+def _validator(monkeypatch, cache_path: str = "") -> ReceiptValidator:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(receipt_validator, "VALIDATION_CACHE_PATH", cache_path)
+    validator = ReceiptValidator()
+    validator.agent = _FakeAgent()
+    validator.duplicate_index = {}
+    return validator
+
+
+def test_cached_verdict_does_not_skip_duplicate_check(monkeypatch):
+    """A receipt with the same content as one reconciled earlier in the run is rejected, not served from cache."""
+    validator = _validator(monkeypatch)
+    
+    first = validator.validate_receipt(_receipt(1))
+    assert first["status"] == "VALID"
+    validator.note_reconciled(_receipt(1))
+    
+    second = validator.validate_receipt(_receipt(2))
+    assert second["status"] == "INVALID"
+    assert second["receipt_id"] == 2
+    assert "DUPLICATE" in second["reasoning"]
+    assert validator.agent.calls == 1
+
+
+def test_disk_cached_verdict_does_not_skip_duplicate_check(monkeypatch, tmp_path):
+    """A verdict persisted by an earlier run is not served once a same-key receipt has been reconciled."""
+    cache_path = str(tmp_path / "validation.sqlite3")
+    assert _validator(monkeypatch, cache_path).validate_receipt(_receipt(1))["status"] == "VALID"
+    
+    validator = _validator(monkeypatch, cache_path)
+    assert validator.validate_receipt(_receipt(3))["status"] == "VALID"  # served from disk
+    validator.note_reconciled(_receipt(1))
+    
+    assert validator.validate_receipt(_receipt(2))["status"] == "INVALID"
+    assert validator.agent.calls == 0
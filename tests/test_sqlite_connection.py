@@ -0,0 +1,229 @@
+"""Tests for SQLite connection operations (no external database required)."""
+
+import asyncio
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import SQLiteConnection
+
+
+def _connect() -> SQLiteConnection:
+    sqlite = SQLiteConnection(connection_name="test_sqlite", database=":memory:")
+    assert sqlite.connect()
+    assert sqlite.execute_update("CREATE TABLE receipts (id INTEGER PRIMARY KEY, status TEXT)")
+    return sqlite
+
+
+def test_execute_many_chunks_and_commits():
+    """execute_many inserts every row across several chunks."""
+    sqlite = _connect()
+    
+    executed = sqlite.execute_many(
+        "INSERT INTO receipts (id, status) VALUES (?, ?)",
+        ((i, "U") for i in range(2500)),
+        chunk_size=1000,
+    )
+    
+    assert executed == 2500
+    assert sqlite.execute_query("SELECT COUNT(*) FROM receipts") == [(2500,)]
+    sqlite.disconnect()
+
+
+def test_execute_many_reports_failure():
+    """execute_many returns -1 and rolls back when the statement fails."""
+    sqlite = _connect()
+    
+    assert sqlite.execute_many("INSERT INTO missing_table VALUES (?)", [(1,)]) == -1
+    sqlite.disconnect()
+
+
+def test_prepared_statement_runs_by_name():
+    """execute_prepared and prepare_many run the SQL registered with prepare()."""
+    sqlite = _connect()
+    sqlite.prepare("insert_receipt", "INSERT INTO receipts (id, status) VALUES (?, ?)")
+    
+    assert sqlite.execute_prepared("insert_receipt", (1, "U"))
+    assert sqlite.prepare_many("insert_receipt", [(2, "U"), (3, "R")]) == 2
+    
+    assert sqlite.execute_query("SELECT id, status FROM receipts ORDER BY id") == [(1, "U"), (2, "U"), (3, "R")]
+    sqlite.disconnect()
+
+
+def test_cursor_is_reused_until_disconnect():
+    """Queries share one cursor per thread, and reconnecting starts a fresh one."""
+    sqlite = _connect()
+    cursor = sqlite._cursor()
+    
+    assert sqlite.execute_update("INSERT INTO receipts (id, status) VALUES (?, ?)", (1, "U"))
+    assert sqlite.execute_query("SELECT id FROM receipts") == [(1,)]
+    assert sqlite._cursor() is cursor
+    
+    sqlite.disconnect()
+    assert sqlite.connect()
+    assert sqlite._cursor() is not cursor
+    assert sqlite.execute_query("SELECT 1") == [(1,)]
+    sqlite.disconnect()
+
+
+def test_last_error_reports_failed_statement():
+    """last_error() returns the driver message of the last failed statement."""
+    sqlite = _connect()
+    assert sqlite.last_error() is None
+    
+    assert not sqlite.execute_update("UPDATE missing_table SET status = ?", ("R",))
+    
+    assert "missing_table" in sqlite.last_error()
+    sqlite.disconnect()
+
+
+def test_execute_query_one_returns_first_row():
+    """execute_query_one returns only the first row, or None when nothing matches."""
+    sqlite = _connect()
+    sqlite.execute_many("INSERT INTO receipts (id, status) VALUES (?, ?)", [(1, "U"), (2, "R")])
+    
+    assert sqlite.execute_query_one("SELECT id, status FROM receipts ORDER BY id") == (1, "U")
+    assert sqlite.execute_query_one("SELECT id FROM receipts WHERE status = 'X'") is None
+    sqlite.disconnect()
+
+
+def test_iter_query_streams_all_rows():
+    """iter_query yields every row as a tuple across several fetch batches."""
+    sqlite = _connect()
+    sqlite.execute_many("INSERT INTO receipts (id, status) VALUES (?, ?)", [(i, "U") for i in range(25)])
+    
+    rows = list(sqlite.iter_query("SELECT id, status FROM receipts ORDER BY id", arraysize=10))
+    
+    assert rows == [(i, "U") for i in range(25)]
+    sqlite.disconnect()
+
+
+def test_transaction_commits_once_on_success():
+    """Updates inside transaction() become visible together when the block exits."""
+    sqlite = _connect()
+    sqlite.execute_many("INSERT INTO receipts (id, status) VALUES (?, ?)", [(1, "U"), (2, "U")])
+    
+    with sqlite.transaction():
+        assert sqlite.execute_update("UPDATE receipts SET status = ? WHERE id = ?", ("R", 1))
+        assert sqlite.execute_update("UPDATE receipts SET status = ? WHERE id = ?", ("R", 2))
+        assert sqlite.in_transaction
+    
+    assert not sqlite.in_transaction
+    assert sqlite.execute_query("SELECT status FROM receipts ORDER BY id") == [("R",), ("R",)]
+    sqlite.disconnect()
+
+
+def test_transaction_rolls_back_on_failed_statement():
+    """A failing statement inside transaction() discards the whole batch."""
+    sqlite = _connect()
+    sqlite.execute_many("INSERT INTO receipts (id, status) VALUES (?, ?)", [(1, "U")])
+    
+    with sqlite.transaction():
+        sqlite.execute_update("UPDATE receipts SET status = ? WHERE id = ?", ("R", 1))
+        assert not sqlite.execute_update("UPDATE missing_table SET status = 'R'")
+        sqlite.execute_update("INSERT INTO receipts (id, status) VALUES (?, ?)", (2, "U"))
+    
+    assert sqlite.execute_query("SELECT id, status FROM receipts ORDER BY id") == [(1, "U")]
+    sqlite.disconnect()
+
+
+def test_async_query_and_update():
+    """aexecute_update/aexecute_query run off the event loop and see committed data."""
+    sqlite = _connect()
+    
+    async def run():
+        assert await sqlite.aexecute_update("INSERT INTO receipts (id, status) VALUES (?, ?)", (1, "U"))
+        return await asyncio.gather(
+            sqlite.aexecute_query("SELECT COUNT(*) FROM receipts"),
+            sqlite.aexecute_query("SELECT status FROM receipts WHERE id = 1"),
+        )
+    
+    counts, statuses = asyncio.run(run())
+    assert counts[0][0] == 1
+    assert statuses[0][0] == "U"
+    assert asyncio.run(sqlite.aexecute_query("SELECT * FROM missing_table")) is None
+    sqlite.disconnect()
+
+
+def test_connected_flag_tracks_connect_and_disconnect():
+    """get_info reports the cheap connected flag without querying the database."""
+    sqlite = SQLiteConnection(connection_name="test_sqlite", database=":memory:")
+    assert not sqlite.is_connected_cheap()
+    
+    assert sqlite.connect()
+    assert sqlite.get_info()["connected"] is True
+    
+    sqlite.disconnect()
+    assert sqlite.get_info()["connected"] is False
+
+
+def test_is_connected_without_probe():
+    """is_connected reflects the connection object and returns a real bool."""
+    sqlite = SQLiteConnection(connection_name="test_sqlite", database=":memory:")
+    assert sqlite.is_connected() is False
+    assert sqlite.connect()
+    assert sqlite.is_connected() is True
+    sqlite.disconnect()
+    assert sqlite.is_connected() is False
+
+
+def test_execute_query_returns_tuples_and_dicts():
+    """execute_query returns plain tuples; execute_query_dict opts in to named columns."""
+    sqlite = _connect()
+    assert sqlite.execute_update("INSERT INTO receipts (id, status) VALUES (?, ?)", (1, "U"))
+    
+    assert sqlite.execute_query("SELECT id, status FROM receipts") == [(1, "U")]
+    assert sqlite.execute_query_dict("SELECT id, status FROM receipts") == [{"id": 1, "status": "U"}]
+    assert sqlite.execute_query("SELECT id FROM receipts WHERE id = 2") == []
+    sqlite.disconnect()
+
+
+def test_connect_applies_pragmas(tmp_path):
+    """File databases are opened in WAL mode with the tuned pragmas."""
+    sqlite = SQLiteConnection(connection_name="test_sqlite", database=str(tmp_path / "lxdb.sqlite"))
+    assert sqlite.connect()
+    
+    assert sqlite.execute_query("PRAGMA journal_mode") == [("wal",)]
+    assert sqlite.execute_query("PRAGMA synchronous") == [(1,)]
+    sqlite.disconnect()
+
+
+def test_execute_query_cached_until_ddl():
+    """Cached catalog results are reused until DDL through execute_update drops them."""
+    sqlite = _connect()
+    tables = "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+    
+    assert sqlite.execute_query_cached(tables) == [("receipts",)]
+    sqlite.connection.execute("CREATE TABLE bypassed (id INTEGER)")
+    assert sqlite.execute_query_cached(tables) == [("receipts",)]
+    
+    assert sqlite.execute_update("CREATE TABLE audit (id INTEGER)")
+    assert sqlite.execute_query_cached(tables) == [("audit",), ("bypassed",), ("receipts",)]
+    sqlite.disconnect()
+
+
+def test_disconnect_closes_cursors_cached_by_other_threads():
+    """Per-thread cursors, including ones cached on other threads, are closed on disconnect."""
+    sqlite = SQLiteConnection(connection_name="test_sqlite", database=":memory:")
+    assert sqlite.connect()
+    cursors = []
+    
+    def use_connection():
+        sqlite.execute_query("SELECT 1")
+        sqlite.execute_query_dict("SELECT 1 AS one")
+        cursors.extend((sqlite._cursor_tls.cursor, sqlite._cursor_tls.row_cursor))
+    
+    worker = threading.Thread(target=use_connection)
+    worker.start()
+    worker.join()
+    sqlite.disconnect()
+    
+    for cursor in cursors:
+        with pytest.raises(sqlite3.ProgrammingError, match="closed cursor"):
+            cursor.execute("SELECT 1")